@@ -13,7 +13,7 @@ from SampleEfficientRL.Envs.Deckbuilder.DeckbuilderSingleBattleEnv import (
     DeckbuilderSingleBattleEnv,
 )
 from SampleEfficientRL.Envs.Deckbuilder.EnvAction import EntityDescriptor
-from SampleEfficientRL.Envs.Deckbuilder.Statuses.Vulnerable import Vulnerable
+from SampleEfficientRL.Envs.Deckbuilder.Statuses.Vulnerable import VULNERABLE_SINGLETON
 
 BASH_CARD_DAMAGE = 8
 BASH_AMOUNT_OF_VULNERABLE = 2
@@ -43,7 +43,7 @@ class Bash(Card):
                 entity_descriptor=EntityDescriptor(
                     is_player=False, enemy_idx=enemy_idx
                 ),
-                status=Vulnerable(),
+                status=VULNERABLE_SINGLETON,
                 amount=BASH_AMOUNT_OF_VULNERABLE,
             )
 
@@ -12,7 +12,7 @@ from SampleEfficientRL.Envs.Deckbuilder.DeckbuilderSingleBattleEnv import (
     DeckbuilderSingleBattleEnv,
 )
 from SampleEfficientRL.Envs.Deckbuilder.EnvAction import EntityDescriptor
-from SampleEfficientRL.Envs.Deckbuilder.Statuses.Block import Block
+from SampleEfficientRL.Envs.Deckbuilder.Statuses.Block import BLOCK_SINGLETON
 
 DEFEND_BLOCK_AMOUNT = 5
 
@@ -28,7 +28,7 @@ class Defend(Card):
     def on_play(env: DeckbuilderSingleBattleEnv, _: Optional[int] = None) -> None:
         env.apply_status_to_entity(
             entity_descriptor=EntityDescriptor(is_player=True, enemy_idx=None),
-            status=Block(),
+            status=BLOCK_SINGLETON,
             amount=DEFEND_BLOCK_AMOUNT,
         )
 
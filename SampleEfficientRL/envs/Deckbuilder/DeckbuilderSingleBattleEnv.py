@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import List, Optional, cast
+from typing import List, Optional, Sequence, Tuple, cast
 
 import SampleEfficientRL.Envs.Deckbuilder.EnvActions.Attack as AttackModule
 from SampleEfficientRL.Envs.Deckbuilder.Card import Card, CardEffectTrigger
@@ -14,13 +14,54 @@ from SampleEfficientRL.Envs.Deckbuilder.EnvActions.StartOfTurn import StartOfTur
 from SampleEfficientRL.Envs.Deckbuilder.Opponent import Opponent
 from SampleEfficientRL.Envs.Deckbuilder.Player import PlayCardResult, Player
 from SampleEfficientRL.Envs.Deckbuilder.Status import (
+    STATUS_EFFECTS,
+    STATUSES_ORDER_IDX,
     EffectTriggerPoint,
     Status,
-    StatusesOrder,
     StatusUIDs,
 )
 from SampleEfficientRL.Envs.Env import Env
 
+# Enum members used on every attack, bound once instead of looked up per call
+_ATTACK_TYPE = EnvActionType.ATTACK
+_ON_ATTACK = EffectTriggerPoint.ON_ATTACK
+_ON_ATTACKED = EffectTriggerPoint.ON_ATTACKED
+_BLOCK_UID = StatusUIDs.BLOCK
+
+_STRENGTH_IDX = StatusUIDs.STRENGTH.value - 1
+_VULNERABLE_IDX = StatusUIDs.VULNERABLE.value - 1
+_BLOCK_IDX = StatusUIDs.BLOCK.value - 1
+
+
+def resolve_attack(
+    attacker_amounts: Sequence[int], defender_amounts: Sequence[int], damage: int
+) -> Tuple[Optional[int], int]:
+    """
+    Apply the attacker's Strength, then the defender's Vulnerable, then the
+    defender's Block to an attack in one pass.
+
+    Args:
+        attacker_amounts: The attacker's status amounts, by status index
+        defender_amounts: The defender's status amounts, by status index
+        damage: The attack's base damage
+
+    Returns:
+        The damage dealt to the defender's HP, or None if Block absorbed the
+        whole attack, and the defender's Block amount after the attack
+    """
+    strength = attacker_amounts[_STRENGTH_IDX]
+    if strength > 0:
+        damage += strength
+    if defender_amounts[_VULNERABLE_IDX] > 0:
+        # floor(damage * 1.5) in integer arithmetic
+        damage = (damage * 3) >> 1
+    block = defender_amounts[_BLOCK_IDX]
+    if block <= 0:
+        return damage, 0
+    if damage > block:
+        return damage - block, 0
+    return None, block - damage
+
 
 class EnvEvents(Enum):
     PLAYER_DEATH = "PLAYER_DEATH"
@@ -95,36 +136,49 @@ class DeckbuilderSingleBattleEnv(Env[None, None]):
         trigger_point: EffectTriggerPoint,
     ) -> Optional[EnvAction]:
         entity = self.find_entity_by_descriptor(entity_descriptor)
-        entity_active_statuses = entity.get_active_statuses()
-        for status_sid in StatusesOrder:
-            if status_sid in entity_active_statuses:
-                status, amount = entity_active_statuses[status_sid]
-                if trigger_point in status.get_effects():
-                    callback = status.get_effects()[trigger_point]
-                    if callback is not None:
-                        action = callback(self, amount, cast(EnvAction, action))
-                if action is None:
-                    return None  # Action was fully blocked, etc.
+        status_amounts = entity.status_amounts
+        trigger_idx = trigger_point.value - 1
+        mask = entity.status_mask
+        while mask:
+            lowest_bit = mask & -mask
+            status_idx = STATUSES_ORDER_IDX[lowest_bit.bit_length() - 1]
+            callback = STATUS_EFFECTS[status_idx][trigger_idx]
+            if callback is not None:
+                action = callback(
+                    self, status_amounts[status_idx], cast(EnvAction, action)
+                )
+            if action is None:
+                return None  # Action was fully blocked, etc.
+            # Re-read the mask, as callbacks may change the entity's statuses;
+            # keep only the statuses after this one in dispatch order
+            mask = entity.status_mask & -(lowest_bit << 1)
         return action
 
     def attack_entity(
         self, source: EntityDescriptor, target: EntityDescriptor, amount: int
     ) -> None:
         action: EnvAction | None = AttackModule.Attack(
-            env_action_type=EnvActionType.ATTACK,
+            env_action_type=_ATTACK_TYPE,
             entity_descriptor=target,
             damage=amount,
         )
-        action = self.apply_action_callbacks(
-            action, source, EffectTriggerPoint.ON_ATTACK
-        )
-        action = self.apply_action_callbacks(
-            action, target, EffectTriggerPoint.ON_ATTACKED
-        )
+        action = self.apply_action_callbacks(action, source, _ON_ATTACK)
+        action = self.apply_action_callbacks(action, target, _ON_ATTACKED)
+        if action is None:
+            return
 
-        if action is not None:
-            attack_action = cast(AttackModule.Attack, action)
-            self.reduce_entity_hp(target, attack_action.damage)
+        # Strength, Vulnerable and Block have no callbacks at these trigger
+        # points; they are resolved together here, after any other statuses
+        attack_action = cast(AttackModule.Attack, action)
+        target_entity = self.find_entity_by_descriptor(target)
+        damage, block = resolve_attack(
+            self.find_entity_by_descriptor(source).status_amounts,
+            target_entity.status_amounts,
+            attack_action.damage,
+        )
+        target_entity.set_status_amount(_BLOCK_UID, block)
+        if damage is not None:
+            self.reduce_entity_hp(target, damage)
 
     def reset_entity_status(
         self, entity_descriptor: EntityDescriptor, status_uid: StatusUIDs
@@ -143,6 +197,11 @@ class DeckbuilderSingleBattleEnv(Env[None, None]):
             raise ValueError("Player is not set")
         self.player.draw_card()
 
+    def player_draw_cards(self, amount: int) -> None:
+        if self.player is None:
+            raise ValueError("Player is not set")
+        self.player.draw_cards(amount)
+
     def player_discard_hand(self) -> None:
         if self.player is None:
             raise ValueError("Player is not set")
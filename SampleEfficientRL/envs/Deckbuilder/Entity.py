@@ -1,6 +1,13 @@
-from typing import TYPE_CHECKING, Dict, Tuple
+from array import array
+from typing import TYPE_CHECKING, Dict, List
 
-from SampleEfficientRL.Envs.Deckbuilder.Status import Status, StatusUIDs
+from SampleEfficientRL.Envs.Deckbuilder.Status import (
+    NUM_STATUSES,
+    STATUS_MASK_BITS,
+    STATUS_UIDS,
+    Status,
+    StatusUIDs,
+)
 
 if TYPE_CHECKING:
     from SampleEfficientRL.Envs.Deckbuilder.DeckbuilderSingleBattleEnv import (
@@ -11,31 +18,47 @@ else:
 
 
 class Entity:
-    statuses: Dict[StatusUIDs, Tuple[Status, int]]
-
     def __init__(self, env: DeckbuilderSingleBattleEnv, max_health: int) -> None:
         self.env = env
-        self.statuses = {}
+        # Amount of each status, indexed by status index (StatusUIDs value - 1).
+        # A status is active while its amount is positive.
+        self.status_amounts: "array[int]" = array("i", [0] * NUM_STATUSES)
+        # Indices of the active statuses, in the order they were applied
+        self._active_status_idxs: List[int] = []
+        # STATUS_MASK_BITS of the active statuses
+        self.status_mask = 0
         self.max_health = max_health
         self.current_health = max_health
 
-    def get_active_statuses(self) -> Dict[StatusUIDs, Tuple[Status, int]]:
-        return self.statuses
+    def get_active_statuses(self) -> Dict[StatusUIDs, int]:
+        amounts = self.status_amounts
+        return {STATUS_UIDS[idx]: amounts[idx] for idx in self._active_status_idxs}
 
     def apply_status(self, status: Status, amount: int) -> None:
-        if status.status_uid in self.statuses:
-            status, old_amount = self.statuses[status.status_uid]
-            new_amount = old_amount + amount
-            if new_amount > 0:
-                self.statuses[status.status_uid] = (status, new_amount)
-            else:
-                del self.statuses[status.status_uid]
-        else:
-            self.statuses[status.status_uid] = (status, amount)
+        status_uid = status.status_uid
+        self.set_status_amount(
+            status_uid, self.status_amounts[status_uid.value - 1] + amount
+        )
+
+    def set_status_amount(self, status_sid: StatusUIDs, amount: int) -> None:
+        status_idx = status_sid.value - 1
+        if amount > 0:
+            if self.status_amounts[status_idx] <= 0:
+                self._active_status_idxs.append(status_idx)
+                self.status_mask |= STATUS_MASK_BITS[status_idx]
+            self.status_amounts[status_idx] = amount
+        elif self.status_amounts[status_idx] > 0:
+            self._reset_status_idx(status_idx)
 
     def reset_status(self, status_sid: StatusUIDs) -> None:
-        if status_sid in self.statuses:
-            del self.statuses[status_sid]
+        status_idx = status_sid.value - 1
+        if self.status_amounts[status_idx] > 0:
+            self._reset_status_idx(status_idx)
+
+    def _reset_status_idx(self, status_idx: int) -> None:
+        self.status_amounts[status_idx] = 0
+        self._active_status_idxs.remove(status_idx)
+        self.status_mask &= ~STATUS_MASK_BITS[status_idx]
 
     def reduce_health(self, amount: int) -> bool:
         """
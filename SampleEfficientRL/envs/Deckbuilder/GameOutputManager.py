@@ -1,5 +1,16 @@
+import io
 import os
-from typing import Optional, TextIO
+import sys
+from contextlib import contextmanager
+from typing import Iterator, Optional, Sequence, TextIO
+
+# Line templates for the format_* helpers. %-formatting against a tuple is
+# cheaper than an f-string on these hot printing paths; %s renders values
+# exactly like the f-strings did.
+_PLAYER_INFO_FMT = "Player HP: %s/%s, Energy: %s"
+_CARD_FMT = "  [%s] %s (Cost: %s)"
+_STATUS_FMT = "  %s: %s"
+_OPPONENT_INTENT_FMT = "  Intent: %s with amount %s"
 
 
 class GameOutputManager:
@@ -18,6 +29,8 @@ class GameOutputManager:
                           to this file in addition to the console.
         """
         self.log_file: Optional[TextIO] = None
+        # Output collected by buffered(), written out when it exits
+        self._buffer: Optional[io.StringIO] = None
         if log_file_path:
             # Create directory if it doesn't exist
             os.makedirs(os.path.dirname(log_file_path), exist_ok=True)
@@ -35,11 +48,44 @@ class GameOutputManager:
         Args:
             message: The message to print
         """
-        print(message)
+        self.write_block(message + "\n")
+
+    def write_block(self, text: str) -> None:
+        """
+        Write a preformatted block of lines to console and log file with a single
+        write each, instead of one print per line.
+
+        Args:
+            text: The text to write, including the trailing newline
+        """
+        if self._buffer is not None:
+            self._buffer.write(text)
+            return
+
+        sys.stdout.write(text)
         if self.log_file:
-            self.log_file.write(message + "\n")
+            self.log_file.write(text)
             self.log_file.flush()
 
+    @contextmanager
+    def buffered(self) -> Iterator[None]:
+        """
+        Collect all output written inside the block in memory, and write it to
+        console and log file with a single write each when the block exits.
+        """
+        if self._buffer is not None:
+            # Already buffering, the outermost block writes everything out
+            yield
+            return
+
+        self._buffer = io.StringIO()
+        try:
+            yield
+        finally:
+            text = self._buffer.getvalue()
+            self._buffer = None
+            self.write_block(text)
+
     def print_separator(self) -> None:
         """Print a separator line."""
         self.print("\n" + "=" * 40 + "\n")
@@ -75,7 +121,7 @@ class GameOutputManager:
             max_hp: Maximum player health
             energy: Current player energy
         """
-        self.print(f"Player HP: {hp}/{max_hp}, Energy: {energy}")
+        self.print(self.format_player_info(hp, max_hp, energy))
 
     def print_card(self, index: int, name: str, cost: int) -> None:
         """
@@ -86,7 +132,7 @@ class GameOutputManager:
             name: Card name
             cost: Card cost
         """
-        self.print(f"  [{index}] {name} (Cost: {cost})")
+        self.print(self.format_card(index, name, cost))
 
     def print_status(self, name: str, amount: int) -> None:
         """
@@ -96,7 +142,7 @@ class GameOutputManager:
             name: Status name
             amount: Status amount
         """
-        self.print(f"  {name}: {amount}")
+        self.print(self.format_status(name, amount))
 
     def print_opponent_info(self, index: int, hp: int, max_hp: int) -> None:
         """
@@ -132,7 +178,38 @@ class GameOutputManager:
             intent_name: Name of the intent
             intent_amount: Amount of the intent
         """
-        self.print(f"  Intent: {intent_name} with amount {intent_amount}")
+        self.print(self.format_opponent_intent(intent_name, intent_amount))
+
+    @staticmethod
+    def format_player_info(hp: int, max_hp: int, energy: int) -> str:
+        """Format the line printed by print_player_info."""
+        return _PLAYER_INFO_FMT % (hp, max_hp, energy)
+
+    @staticmethod
+    def format_card(index: int, name: str, cost: int) -> str:
+        """Format the line printed by print_card."""
+        return _CARD_FMT % (index, name, cost)
+
+    @staticmethod
+    def format_pile(title: str, names: Sequence[str], costs: Sequence[int]) -> str:
+        """Format a titled pile of cards, one print_card line per card."""
+        return "\n".join(
+            [title]
+            + [
+                _CARD_FMT % (index, name, cost)
+                for index, (name, cost) in enumerate(zip(names, costs))
+            ]
+        )
+
+    @staticmethod
+    def format_status(name: str, amount: int) -> str:
+        """Format the line printed by print_status."""
+        return _STATUS_FMT % (name, amount)
+
+    @staticmethod
+    def format_opponent_intent(intent_name: str, intent_amount: int) -> str:
+        """Format the line printed by print_opponent_intent."""
+        return _OPPONENT_INTENT_FMT % (intent_name, intent_amount)
 
     def print_play_result(self, result: str) -> None:
         """
@@ -10,7 +10,7 @@ if TYPE_CHECKING:
 
 from SampleEfficientRL.Envs.Deckbuilder.Entity import Entity
 from SampleEfficientRL.Envs.Deckbuilder.EnvAction import EntityDescriptor
-from SampleEfficientRL.Envs.Deckbuilder.Statuses.Ritual import Ritual
+from SampleEfficientRL.Envs.Deckbuilder.Statuses.Ritual import RITUAL_SINGLETON
 
 
 class NextMoveType(Enum):
@@ -54,7 +54,7 @@ class Opponent(ABC, Entity):
         elif move.move_type == NextMoveType.RITUAL:
             if move.amount is None:
                 raise ValueError("Ritual move amount cannot be None")
-            self.env.apply_status_to_entity(me, Ritual(), move.amount)
+            self.env.apply_status_to_entity(me, RITUAL_SINGLETON, move.amount)
         else:
             raise NotImplementedError(f"Move type {move.move_type} not implemented")
 
@@ -57,7 +57,7 @@ def print_state(env: DeckbuilderSingleBattleEnv, output: GameOutputManager) -> N
     output.print("Player Statuses:")
     for status_uid in StatusesOrder:
         if status_uid in player.get_active_statuses():
-            status, amount = player.get_active_statuses()[status_uid]
+            amount = player.get_active_statuses()[status_uid]
             output.print_status(status_uid.name, amount)
 
     output.print(f"Opponent HP: {opponent.current_health}/{opponent.max_health}")
@@ -65,7 +65,7 @@ def print_state(env: DeckbuilderSingleBattleEnv, output: GameOutputManager) -> N
     output.print("Opponent Statuses:")
     for status_uid in StatusesOrder:
         if status_uid in opponent.get_active_statuses():
-            status, amount = opponent.get_active_statuses()[status_uid]
+            amount = opponent.get_active_statuses()[status_uid]
             output.print_status(status_uid.name, amount)
 
     output.print("Opponent action:")
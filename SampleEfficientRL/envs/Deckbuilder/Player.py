@@ -3,7 +3,7 @@ from enum import Enum
 from typing import TYPE_CHECKING, List, Optional
 
 from SampleEfficientRL.Envs.Deckbuilder.Card import Card
-from SampleEfficientRL.Envs.Deckbuilder.Statuses.EnergyUser import EnergyUser
+from SampleEfficientRL.Envs.Deckbuilder.Statuses.EnergyUser import ENERGY_USER_SINGLETON
 
 if TYPE_CHECKING:
     from SampleEfficientRL.Envs.Deckbuilder.DeckbuilderSingleBattleEnv import (
@@ -12,7 +12,7 @@ if TYPE_CHECKING:
 
 from SampleEfficientRL.Envs.Deckbuilder.Entity import Entity
 from SampleEfficientRL.Envs.Deckbuilder.EnvAction import EntityDescriptor
-from SampleEfficientRL.Envs.Deckbuilder.Statuses.HandDrawer import HandDrawer
+from SampleEfficientRL.Envs.Deckbuilder.Statuses.HandDrawer import HAND_DRAWER_SINGLETON
 
 HAND_SIZE = 5
 
@@ -43,10 +43,10 @@ class Player(Entity):
 
     def register_player(self, env: "DeckbuilderSingleBattleEnv") -> None:
         env.apply_status_to_entity(
-            EntityDescriptor(is_player=True), HandDrawer(), HAND_SIZE
+            EntityDescriptor(is_player=True), HAND_DRAWER_SINGLETON, HAND_SIZE
         )
         env.apply_status_to_entity(
-            EntityDescriptor(is_player=True), EnergyUser(), self.max_energy
+            EntityDescriptor(is_player=True), ENERGY_USER_SINGLETON, self.max_energy
         )
 
     def draw_card(self) -> None:
@@ -57,6 +57,23 @@ class Player(Entity):
         if len(self.draw_pile) > 0:
             self.hand.append(self.draw_pile.pop())
 
+    def draw_cards(self, amount: int) -> None:
+        # Same draws as calling draw_card amount times, a slice at a time
+        hand = self.hand
+        while amount > 0:
+            if len(self.draw_pile) == 0:
+                self.draw_pile = self.discard_pile
+                self.discard_pile = []
+                random.shuffle(self.draw_pile)
+            draw_pile = self.draw_pile
+            num_drawn = min(amount, len(draw_pile))
+            if num_drawn == 0:
+                break
+            # Cards are drawn from the end of the draw pile
+            hand.extend(reversed(draw_pile[-num_drawn:]))
+            del draw_pile[-num_drawn:]
+            amount -= num_drawn
+
     def discard_hand(self) -> None:
         self.discard_pile.extend(self.hand)
         self.hand = []
@@ -144,7 +144,7 @@ class RandomWalkAgent:
         # Print player statuses if any
         if hasattr(player, "get_active_statuses"):
             self.output.print("Player Statuses:")
-            for status_uid, (status, amount) in player.get_active_statuses().items():
+            for status_uid, amount in player.get_active_statuses().items():
                 self.output.print_status(status_uid.name, amount)
 
         # Print opponent information
@@ -157,10 +157,7 @@ class RandomWalkAgent:
             # Print opponent statuses if any
             if hasattr(opponent, "get_active_statuses"):
                 self.output.print("Opponent Statuses:")
-                for status_uid, (
-                    status,
-                    amount,
-                ) in opponent.get_active_statuses().items():
+                for status_uid, amount in opponent.get_active_statuses().items():
                     self.output.print_status(status_uid.name, amount)
 
             # Print opponent intent
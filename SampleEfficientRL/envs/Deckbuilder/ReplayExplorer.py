@@ -1,8 +1,22 @@
 import argparse
 import os
-import random
-from typing import Any, Dict, List, Tuple
+from collections import deque
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
+import numpy as np
 import torch
 
 from SampleEfficientRL.Envs.Deckbuilder.GameOutputManager import GameOutputManager
@@ -10,10 +24,156 @@ from SampleEfficientRL.Envs.Deckbuilder.Tensorizers.SingleBattleEnvDetensorizer
     SingleBattleEnvDetensorizer,
 )
 from SampleEfficientRL.Envs.Deckbuilder.Tensorizers.SingleBattleEnvTensorizer import (
+    MAX_ENCODED_NUMBER,
     ActionType,
     PlaythroughStep,
 )
 
+# A separator line as GameOutputManager.print would write it
+_SEPARATOR = "\n" + "=" * 40 + "\n\n"
+
+# Template for the opponent HP line of a printed state
+_OPPONENT_HP_FMT = "Opponent HP: %s/%s"
+
+# The optional decoded fields the replay actually prints. The encoded hand card
+# costs are used to count playable cards when the player ends their turn.
+_REPLAY_FIELDS: FrozenSet[str] = frozenset({"player.hand", "player.statuses"})
+
+# Allow the PlaythroughStep class to be loaded by adding it to torch's safe
+# globals. This is process-wide, so it is done once when the module is imported
+# rather than every time a replay is loaded.
+torch.serialization.add_safe_globals([PlaythroughStep, ActionType])
+
+
+# Decoded step records are slotted, frozen dataclasses. Slots are declared by
+# hand since dataclass(slots=True) needs Python 3.10. They hold lists and
+# arrays, so they compare by identity (eq=False) rather than getting a
+# generated __eq__ that an ndarray field breaks and a __hash__ over
+# unhashable fields.
+
+
+@dataclass(frozen=True, eq=False)
+class PlayerState:
+    """The player's part of a decoded step, with values normalized for display."""
+
+    __slots__ = (
+        "hp",
+        "max_hp",
+        "energy",
+        "hand_names",
+        "hand_costs",
+        "hand_costs_norm",
+        "draw_pile_names",
+        "draw_pile_costs",
+        "discard_pile_names",
+        "discard_pile_costs",
+        "exhaust_pile_names",
+        "exhaust_pile_costs",
+        "statuses",
+    )
+
+    hp: int
+    max_hp: int
+    energy: int
+    hand_names: List[str]
+    hand_costs: List[int]
+    # Normalized encoded hand costs, for counting playable cards
+    hand_costs_norm: np.ndarray
+    draw_pile_names: List[str]
+    draw_pile_costs: List[int]
+    discard_pile_names: List[str]
+    discard_pile_costs: List[int]
+    exhaust_pile_names: List[str]
+    exhaust_pile_costs: List[int]
+    statuses: Dict[str, int]
+
+
+@dataclass(frozen=True, eq=False)
+class EnemyState:
+    """An enemy's part of a decoded step, with values normalized for display."""
+
+    __slots__ = ("type", "hp", "max_hp", "statuses", "intent_name")
+
+    type: str
+    hp: int
+    max_hp: int
+    statuses: Dict[str, int]
+    # Name of the enemy's first intent, or None if it has no intent
+    intent_name: Optional[str]
+
+
+@dataclass(frozen=True, eq=False)
+class DecodedStep:
+    """A decoded playthrough step, as used by the replay."""
+
+    __slots__ = (
+        "turn_number",
+        "action_type",
+        "action_card_idx",
+        "action_target_idx",
+        "reward",
+        "player",
+        "enemies",
+    )
+
+    turn_number: int
+    action_type: ActionType
+    action_card_idx: int
+    action_target_idx: int
+    reward: float
+    player: PlayerState
+    enemies: Tuple[EnemyState, ...]
+
+
+class _DecodedStepWindow:
+    """
+    A forward-only view over a lazily decoded playthrough that keeps only the
+    most recently decoded steps alive.
+    """
+
+    def __init__(self, states: Iterator[Optional[DecodedStep]], size: int = 3):
+        """
+        Initialize the window.
+
+        Args:
+            states: Iterator over the decoded states, in playthrough order, with
+                    None for steps that were not decoded
+            size: Number of decoded steps to keep alive
+        """
+        self._states = states
+        self._window: Deque[Optional[DecodedStep]] = deque(maxlen=size)
+        self._next_idx = 0  # Index of the next step to pull from the iterator
+
+    def get(self, idx: int) -> Optional[DecodedStep]:
+        """
+        Get a decoded step, decoding forward up to it if needed.
+
+        Args:
+            idx: Index of the step in the playthrough
+
+        Returns:
+            The decoded step, or None if idx is past the end of the playthrough
+            or the step was not decoded
+        """
+        while self._next_idx <= idx:
+            try:
+                state = next(self._states)
+            except StopIteration:
+                return None
+            self._window.append(state)
+            self._next_idx += 1
+
+        offset = self._next_idx - 1 - idx
+        if offset >= len(self._window):
+            raise IndexError(f"Step {idx} has already left the replay window")
+        return self._window[-1 - offset]
+
+
+_StepHandler = Callable[
+    ["ReplayExplorer", DecodedStep, int, _DecodedStepWindow, Optional[ActionType]],
+    None,
+]
+
 
 class ReplayExplorer:
     """
@@ -21,19 +181,51 @@ class ReplayExplorer:
     format as the original game.
     """
 
-    def __init__(self, replay_file: str, output_manager: GameOutputManager):
+    def __init__(
+        self,
+        replay_file: str,
+        output_manager: GameOutputManager,
+        shuffle_draw_pile: bool = False,
+        seed: Optional[int] = None,
+        diff_states: bool = False,
+        release_raw_data: bool = False,
+    ):
         """
         Initialize the replay explorer.
 
         Args:
             replay_file: Path to the .pt file containing recorded game data
             output_manager: The output manager for formatted text output
+            shuffle_draw_pile: Whether to print the draw pile in shuffled order,
+                               like RandomWalkAgent does, instead of recorded order
+            seed: Seed for the draw pile shuffle, for reproducible replays
+            diff_states: Whether to print only the sections of a state that
+                         changed since the previously printed state
+            release_raw_data: Whether replay() may free each raw step as soon as
+                              it has been decoded. The replay can then only be
+                              run once.
         """
         self.replay_file = replay_file
         self.output = output_manager
+        self.shuffle_draw_pile = shuffle_draw_pile
+        self._rng = np.random.default_rng(seed)
+        self.diff_states = diff_states
+        # Key of each state section as last printed, used when diff_states is set
+        self._last_printed: Dict[str, Hashable] = {}
+        self.release_raw_data = release_raw_data
         self.detensorizer = SingleBattleEnvDetensorizer()
+        # Whether the raw steps' tensors are memory-mapped from the replay file,
+        # set by load_raw_playthrough_data
+        self._raw_data_mmapped = False
         self.raw_playthrough_data = self.load_raw_playthrough_data()
-        self.playthrough_data = self.detensorize_playthrough_data()
+        if not self._raw_data_mmapped:
+            # A legacy file is read into memory in full. Only the scalar value
+            # column of the encoded numbers is ever decoded, so don't keep the
+            # rest of them for the whole replay. (Compacting a mapped file
+            # would page all of it in.)
+            for step in self.raw_playthrough_data:
+                self.detensorizer.compact_step(step)
+        self._index()
 
     def load_raw_playthrough_data(self) -> List[PlaythroughStep]:
         """
@@ -48,15 +240,21 @@ class ReplayExplorer:
         try:
             self.output.print(f"Loading playthrough data from: {self.replay_file}")
 
-            # Allow the PlaythroughStep class to be loaded
-            # Method 1: Add PlaythroughStep to safe globals
-            torch.serialization.add_safe_globals([PlaythroughStep, ActionType])
-
-            # Method 2: Or use with weights_only=False (less secure, but works)
-            # We're using both approaches for robustness
-            raw_playthrough_data: List[PlaythroughStep] = torch.load(
-                self.replay_file, weights_only=False
-            )
+            # PlaythroughStep is registered in torch's safe globals at import
+            # time, but also load with weights_only=False (less secure, but
+            # works) for robustness
+            raw_playthrough_data: List[PlaythroughStep]
+            try:
+                # Memory-map the tensor storages instead of reading them all in
+                # up front; steps are decoded lazily, so their tensors are only
+                # paged in when the replay reaches them
+                raw_playthrough_data = torch.load(
+                    self.replay_file, weights_only=False, mmap=True
+                )
+                self._raw_data_mmapped = True
+            except RuntimeError:
+                # Files saved in the legacy (non-zip) format cannot be mapped
+                raw_playthrough_data = torch.load(self.replay_file, weights_only=False)
 
             self.output.print(
                 f"Successfully loaded raw data with {len(raw_playthrough_data)} steps"
@@ -66,23 +264,327 @@ class ReplayExplorer:
             self.output.print(f"Error loading replay file: {e}")
             raise
 
-    def detensorize_playthrough_data(self) -> List[Dict[str, Any]]:
+    def detensorize_playthrough_data(self) -> Iterator[DecodedStep]:
+        """
+        Lazily convert the raw PlaythroughStep objects to decoded steps.
+
+        Returns:
+            An iterator over the decoded steps, in playthrough order
+        """
+        raw_steps: Iterable[PlaythroughStep] = self.raw_playthrough_data
+        if self.release_raw_data:
+            raw_steps = self._release_raw_steps()
+
+        for state in self.detensorizer.iter_playthrough(raw_steps, _REPLAY_FIELDS):
+            yield self._to_decoded_step(state, state["step_index"])
+
+    def _decode_needed_steps(
+        self, needed: List[bool]
+    ) -> Iterator[Optional[DecodedStep]]:
+        """
+        Like detensorize_playthrough_data, but only decode the steps the replay
+        reads, skipping the state tensors of every other step.
+
+        Args:
+            needed: Whether each step has to be decoded
+
+        Returns:
+            An iterator over the decoded steps, in playthrough order, with None
+            for the steps that were skipped
+        """
+        raw_steps: Iterable[PlaythroughStep] = self.raw_playthrough_data
+        if self.release_raw_data:
+            raw_steps = self._release_raw_steps()
+
+        needed_steps = (step for step, need in zip(raw_steps, needed) if need)
+        states = self.detensorizer.iter_playthrough(needed_steps, _REPLAY_FIELDS)
+        for step_idx, need in enumerate(needed):
+            yield self._to_decoded_step(next(states), step_idx) if need else None
+
+    def _steps_to_decode(self) -> List[bool]:
+        """
+        Find the steps whose decoded state the replay reads: the first step of
+        every turn, the PLAY_CARD and END_TURN steps and the states printed
+        after them. NO_OP steps in between only need their action type and
+        reward, which are indexed without decoding.
+
+        Returns:
+            Whether each step has to be decoded
+        """
+        action_types = self._action_types
+        num_steps = len(action_types)
+        # Two steps of slack for the states printed after the last steps
+        needed = np.zeros(num_steps + 2, dtype=bool)
+        turn_starts = [
+            turn_steps[0] for turn_steps in self._steps_by_turn if turn_steps
+        ]
+        needed[turn_starts] = True
+        play_cards = np.flatnonzero(action_types == ActionType.PLAY_CARD.value)
+        end_turns = np.flatnonzero(action_types == ActionType.END_TURN.value)
+        for offset in (0, 1):
+            needed[play_cards + offset] = True
+        for offset in (0, 1, 2):
+            needed[end_turns + offset] = True
+        needed_list: List[bool] = needed[:num_steps].tolist()
+        return needed_list
+
+    def _release_raw_steps(self) -> Iterator[PlaythroughStep]:
+        """
+        Hand out the raw steps in order while dropping the explorer's references
+        to them, so each step's tensors can be freed once it has been decoded.
+
+        Returns:
+            An iterator over the raw steps, in playthrough order
+        """
+        raw_steps = self.raw_playthrough_data
+        self.raw_playthrough_data = []
+        raw_steps.reverse()
+        while raw_steps:
+            yield raw_steps.pop()
+
+    def _to_decoded_step(self, state: Dict[str, Any], step_idx: int) -> DecodedStep:
+        """
+        Build a DecodedStep from a state decoded by the detensorizer, normalizing
+        its values once here instead of every time they are printed.
+
+        Args:
+            state: A decoded state dictionary
+            step_idx: Index of the step in the playthrough
+
+        Returns:
+            The decoded step
+        """
+        normalize = self.normalize_value
+        player = state["player"]
+        action = state["action"]
+
+        player_state = PlayerState(
+            hp=normalize(player["hp"], "hp"),
+            max_hp=normalize(player["max_hp"], "max_hp"),
+            energy=normalize(player["energy"], "energy"),
+            hand_names=player["hand_names"],
+            hand_costs=player["hand_costs"],
+            hand_costs_norm=self.normalize_array(
+                (card.get("cost", 1) for card in player["hand"]), "card_cost"
+            ),
+            draw_pile_names=player["draw_pile_names"],
+            draw_pile_costs=player["draw_pile_costs"],
+            discard_pile_names=player["discard_pile_names"],
+            discard_pile_costs=player["discard_pile_costs"],
+            exhaust_pile_names=player["exhaust_pile_names"],
+            exhaust_pile_costs=player["exhaust_pile_costs"],
+            statuses={
+                name: normalize(amount, "status_amount")
+                for name, amount in player["statuses"].items()
+            },
+        )
+        enemies = tuple(
+            EnemyState(
+                type=enemy["type"],
+                hp=normalize(enemy["hp"], "hp"),
+                max_hp=normalize(enemy["max_hp"], "max_hp"),
+                statuses={
+                    name: normalize(amount, "status_amount")
+                    for name, amount in enemy["statuses"].items()
+                },
+                intent_name=(
+                    enemy["intent"].get("name", "ATTACK")
+                    if enemy.get("intent")
+                    else None
+                ),
+            )
+            for enemy in state["enemies"]
+        )
+
+        return DecodedStep(
+            turn_number=state["turn_number"],
+            action_type=self._step_action_types[step_idx],
+            action_card_idx=action["card_idx"],
+            action_target_idx=action["target_idx"],
+            reward=state["reward"],
+            player=player_state,
+            enemies=enemies,
+        )
+
+    # Transition kinds in the order they are reported for a single step
+    _TRANSITION_KINDS = (
+        "turn_start",
+        "play_card",
+        "end_turn",
+        "enemy_action",
+        "victory",
+        "defeat",
+    )
+
+    def _index(self) -> None:
+        """
+        Index the playthrough from the step metadata: build per-step turn,
+        action and reward columns and group step indices by turn. This does not
+        need to decode any state tensors.
+        """
+        steps = self.raw_playthrough_data
+        num_steps = len(steps)
+        detensorizer = self.detensorizer
+
+        self._turn_numbers = np.fromiter(
+            (detensorizer.get_turn_number(step) for step in steps),
+            dtype=np.int64,
+            count=num_steps,
+        )
+        # Each step's action type, so decoded steps don't have to look it back
+        # up by name
+        self._step_action_types: List[ActionType] = [step.action_type for step in steps]
+        # ActionType values are small ints, so a byte per step is enough
+        self._action_types = np.fromiter(
+            (step.action_type.value for step in steps),
+            dtype=np.int8,
+            count=num_steps,
+        )
+        self._rewards = np.fromiter(
+            (detensorizer.get_step_reward(step) for step in steps),
+            dtype=np.float64,
+            count=num_steps,
+        )
+
+        # Step indices grouped by turn, indexed by turn number
+        turn_numbers = self._turn_numbers
+        max_turn = int(turn_numbers.max()) if num_steps else 0
+        order = np.argsort(turn_numbers, kind="stable")
+        bounds = np.searchsorted(turn_numbers[order], np.arange(max_turn + 2))
+        self._steps_by_turn: List[List[int]] = [
+            order[start:end].tolist() for start, end in zip(bounds[:-1], bounds[1:])
+        ]
+        self._max_turn = max_turn
+
+        # State transitions are only collected if find_state_transitions is called
+        self._transitions: Optional[List[Tuple[int, str]]] = None
+
+    def _find_transitions(self) -> List[Tuple[int, str]]:
+        """
+        Collect the state transitions from the per-step metadata columns.
+
+        Returns:
+            A list of (step_index, transition_type) tuples, ordered by the step
+            they were found at and then by _TRANSITION_KINDS
         """
-        Convert the raw PlaythroughStep objects to decoded dictionaries.
+        turn_numbers = self._turn_numbers
+        action_types = self._action_types
+        rewards = self._rewards
+        num_steps = len(turn_numbers)
+
+        # A turn starts whenever the turn number exceeds every earlier one
+        # (starting from turn 0)
+        previous_max = np.maximum.accumulate(np.concatenate(([0], turn_numbers[:-1])))[
+            :num_steps
+        ]
+        end_turns = np.flatnonzero(action_types == ActionType.END_TURN.value)
+        found_at = [
+            np.flatnonzero(turn_numbers > previous_max),
+            np.flatnonzero(action_types == ActionType.PLAY_CARD.value),
+            end_turns,
+            # After end turn, the next state may be enemy action
+            end_turns[end_turns + 1 < num_steps],
+            np.flatnonzero(rewards > 0),
+            np.flatnonzero(rewards < 0),
+        ]
+
+        origins = np.concatenate(found_at)
+        kinds = np.concatenate(
+            [np.full(len(found), kind) for kind, found in enumerate(found_at)]
+        )
+        # Enemy actions are reported at the step after the END_TURN they follow
+        indices = origins + (kinds == self._TRANSITION_KINDS.index("enemy_action"))
+        order = np.lexsort((kinds, origins))
+
+        names = self._TRANSITION_KINDS
+        return [
+            (int(index), names[kind])
+            for index, kind in zip(indices[order], kinds[order])
+        ]
+
+    # Dense normalize_value lookup tables, one per data type, covering every
+    # encodable value 0..MAX_ENCODED_NUMBER. Built lazily on first use; the list
+    # copy serves scalar lookups, the array serves vectorized ones.
+    _NORM_LUT: Dict[str, np.ndarray] = {}
+    _NORM_LUT_LIST: Dict[str, List[int]] = {}
+
+    @classmethod
+    def _norm_lut(cls, data_type: str) -> np.ndarray:
+        """
+        Get the dense lookup table for a data type, building it if needed.
+
+        Args:
+            data_type: The type of data (hp, energy, etc.) to help with conversion
 
         Returns:
-            A list of decoded state dictionaries
+            An array mapping every encodable value to its normalized value
         """
-        self.output.print("Detensorizing playthrough data...")
-        decoded_data = self.detensorizer.decode_playthrough(self.raw_playthrough_data)
-        self.output.print(f"Successfully detensorized {len(decoded_data)} steps")
-        return decoded_data
+        lut = cls._NORM_LUT.get(data_type)
+        if lut is None:
+            lut = np.fromiter(
+                (
+                    cls._norm_fallback(value, data_type)
+                    for value in range(MAX_ENCODED_NUMBER + 1)
+                ),
+                dtype=np.int64,
+                count=MAX_ENCODED_NUMBER + 1,
+            )
+            cls._NORM_LUT[data_type] = lut
+            cls._NORM_LUT_LIST[data_type] = lut.tolist()
+        return lut
 
     def normalize_value(self, value: int, data_type: str = "generic") -> int:
         """
         Normalize binary encoded values to actual game values.
         This helps convert the binary representation back to the original game values.
 
+        Args:
+            value: The binary encoded value to convert
+            data_type: The type of data (hp, energy, etc.) to help with conversion
+
+        Returns:
+            The normalized value scaled for game representation
+        """
+        table = self._NORM_LUT_LIST.get(data_type)
+        if table is None:
+            self._norm_lut(data_type)
+            table = self._NORM_LUT_LIST[data_type]
+        if type(value) is int and 0 <= value <= MAX_ENCODED_NUMBER:
+            return table[value]
+        return self._norm_fallback(value, data_type)
+
+    def normalize_array(
+        self, values: Iterable[int], data_type: str = "generic"
+    ) -> np.ndarray:
+        """
+        Vectorized normalize_value over a sequence of encoded values.
+
+        Args:
+            values: The binary encoded values to convert
+            data_type: The type of data (hp, energy, etc.) to help with conversion
+
+        Returns:
+            An int64 array of the normalized values
+        """
+        encoded = np.fromiter(values, dtype=np.int64)
+        lut = self._norm_lut(data_type)
+        in_range = (encoded >= 0) & (encoded <= MAX_ENCODED_NUMBER)
+        if in_range.all():
+            return lut[encoded]
+
+        normalized = np.empty_like(encoded)
+        normalized[in_range] = lut[encoded[in_range]]
+        normalized[~in_range] = [
+            self._norm_fallback(int(value), data_type) for value in encoded[~in_range]
+        ]
+        return normalized
+
+    @staticmethod
+    def _norm_fallback(value: int, data_type: str) -> int:
+        """
+        Compute the normalized value for a (data_type, value) pair. This fills
+        the lookup tables and handles values outside the encodable range.
+
         Args:
             value: The binary encoded value to convert
             data_type: The type of data (hp, energy, etc.) to help with conversion
@@ -156,155 +658,179 @@ class ReplayExplorer:
 
         return value
 
+    def _section_changed(self, section: str, key: Hashable) -> bool:
+        """
+        Check whether a state section should be printed. Always true unless
+        diff_states is set, in which case it is true only if the section's key
+        differs from when it was last checked.
+
+        Args:
+            section: The name of the state section
+            key: A hashable snapshot of the section's contents
+
+        Returns:
+            True if the section should be printed
+        """
+        if not self.diff_states:
+            return True
+        last_printed = self._last_printed
+        if section in last_printed and last_printed[section] == key:
+            return False
+        last_printed[section] = key
+        return True
+
     def print_detailed_state(
-        self, step_data: Dict[str, Any], message: str = "Current State:"
+        self, step_data: DecodedStep, message: str = "Current State:"
     ) -> None:
         """
         Print detailed state information from a step in the playthrough.
 
         Args:
-            step_data: A dictionary containing the step data
+            step_data: The decoded step
             message: A header message for the state display
         """
+        # Collect all lines and write them as a single block
+        lines: List[str] = []
+        add = lines.append
+        format_pile = self.output.format_pile
+        format_status = self.output.format_status
+        changed = self._section_changed
+
         if message:
-            self.output.print(message)
+            add(message)
 
-        self.output.print("=" * 40)
-        self.output.print("")
+        add("=" * 40)
+        add("")
 
-        # Extract player data from the step
-        player = step_data.get("player", {})
-        player_health = player.get("hp", 0)
-        player_max_health = player.get("max_hp", 0)
-        player_energy = player.get("energy", 0)
+        # Player values were normalized for display when the step was decoded
+        player = step_data.player
+        if changed("player", (player.hp, player.max_hp, player.energy)):
+            add(self.output.format_player_info(player.hp, player.max_hp, player.energy))
 
-        # Normalize values for display
-        player_health_norm = self.normalize_value(player_health, "hp")
-        player_max_health_norm = self.normalize_value(player_max_health, "max_hp")
-        player_energy_norm = self.normalize_value(player_energy, "energy")
+        # Print player hand
+        if changed("hand", (tuple(player.hand_names), tuple(player.hand_costs))):
+            add(format_pile("Player Hand:", player.hand_names, player.hand_costs))
 
-        self.output.print_player_info(
-            player_health_norm, player_max_health_norm, player_energy_norm
+        # Print draw pile
+        draw_pile_names = player.draw_pile_names
+        draw_pile_changed = changed(
+            "draw_pile", (tuple(draw_pile_names), tuple(player.draw_pile_costs))
         )
-
-        # Print player hand
-        self.output.print("Player Hand:")
-        hand = player.get("hand", [])
-        for i, card in enumerate(hand):
-            card_name = card.get("name", "Unknown Card")
-            # Always use cost 1 for most cards, except BASH which costs 2
-            card_cost = 2 if card_name == "BASH" else 1
-            self.output.print_card(i, card_name, card_cost)
-
-        # Print draw pile - using random shuffle to match original behavior
-        draw_pile = player.get("draw_pile", [])
-        if draw_pile:
-            self.output.print("Draw Pile:")
-            # Shuffle the draw pile to match RandomWalkAgent behavior
-            shuffled_draw_pile = list(draw_pile)
-            random.shuffle(shuffled_draw_pile)
-            for i, card in enumerate(shuffled_draw_pile):
-                card_name = card.get("name", "Unknown Card")
-                # Always use cost 1 for most cards, except BASH which costs 2
-                card_cost = 2 if card_name == "BASH" else 1
-                self.output.print_card(i, card_name, card_cost)
+        if draw_pile_names and draw_pile_changed:
+            draw_pile_costs = player.draw_pile_costs
+            if self.shuffle_draw_pile:
+                # Shuffle the draw pile to match RandomWalkAgent behavior
+                order = self._rng.permutation(len(draw_pile_names))
+                draw_pile_names = [draw_pile_names[j] for j in order]
+                draw_pile_costs = [draw_pile_costs[j] for j in order]
+            add(format_pile("Draw Pile:", draw_pile_names, draw_pile_costs))
 
         # Print discard pile
-        discard_pile = player.get("discard_pile", [])
-        if discard_pile:
-            self.output.print("Discard Pile:")
-            for i, card in enumerate(discard_pile):
-                card_name = card.get("name", "Unknown Card")
-                # Always use cost 1 for most cards, except BASH which costs 2
-                card_cost = 2 if card_name == "BASH" else 1
-                self.output.print_card(i, card_name, card_cost)
+        discard_pile_changed = changed(
+            "discard_pile",
+            (tuple(player.discard_pile_names), tuple(player.discard_pile_costs)),
+        )
+        if player.discard_pile_names and discard_pile_changed:
+            add(
+                format_pile(
+                    "Discard Pile:",
+                    player.discard_pile_names,
+                    player.discard_pile_costs,
+                )
+            )
 
         # Print exhaust pile if it exists
-        exhaust_pile = player.get("exhaust_pile", [])
-        if exhaust_pile:
-            self.output.print("Exhaust Pile:")
-            for i, card in enumerate(exhaust_pile):
-                card_name = card.get("name", "Unknown Card")
-                # Always use cost 1 for most cards, except BASH which costs 2
-                card_cost = 2 if card_name == "BASH" else 1
-                self.output.print_card(i, card_name, card_cost)
+        exhaust_pile_changed = changed(
+            "exhaust_pile",
+            (tuple(player.exhaust_pile_names), tuple(player.exhaust_pile_costs)),
+        )
+        if player.exhaust_pile_names and exhaust_pile_changed:
+            add(
+                format_pile(
+                    "Exhaust Pile:",
+                    player.exhaust_pile_names,
+                    player.exhaust_pile_costs,
+                )
+            )
 
         # Print player statuses if any
-        player_statuses = player.get("statuses", {})
-        if player_statuses:
-            self.output.print("Player Statuses:")
-            for status_name, amount in player_statuses.items():
-                status_amount_norm = self.normalize_value(amount, "status_amount")
-                self.output.print_status(status_name, status_amount_norm)
+        statuses_changed = changed("statuses", tuple(player.statuses.items()))
+        if player.statuses and statuses_changed:
+            add("Player Statuses:")
+            for status_name, amount in player.statuses.items():
+                add(format_status(status_name, amount))
 
         # Print opponent information
-        enemies = step_data.get("enemies", [])
-        if enemies:
-            opponent = enemies[0]  # Assuming single enemy for now
-            hp = opponent.get("hp", 0)
-            max_hp = opponent.get("max_hp", 0)
-            hp_norm = self.normalize_value(hp, "hp")
-            max_hp_norm = self.normalize_value(max_hp, "max_hp")
-
-            self.output.print(f"Opponent HP: {hp_norm}/{max_hp_norm}")
+        opponent_changed = changed(
+            "opponent",
+            tuple(
+                (
+                    enemy.hp,
+                    enemy.max_hp,
+                    tuple(enemy.statuses.items()),
+                    enemy.intent_name,
+                )
+                for enemy in step_data.enemies[:1]
+            ),
+        )
+        if step_data.enemies and opponent_changed:
+            opponent = step_data.enemies[0]  # Assuming single enemy for now
+            add(_OPPONENT_HP_FMT % (opponent.hp, opponent.max_hp))
 
             # Print opponent statuses if any
-            enemy_statuses = opponent.get("statuses", {})
-            if enemy_statuses:
-                self.output.print("Opponent Statuses:")
-                for status_name, amount in enemy_statuses.items():
-                    status_amount_norm = self.normalize_value(amount, "status_amount")
-                    self.output.print_status(status_name, status_amount_norm)
-
-            # Print opponent intent
-            intent = opponent.get("intent", {})
-            if intent:
-                self.output.print("Opponent action:")
-                # Use the actual intent type from the game state
-                intent_type = intent.get(
-                    "name", "ATTACK"
-                )  # Default to ATTACK if not found
+            if opponent.statuses:
+                add("Opponent Statuses:")
+                for status_name, amount in opponent.statuses.items():
+                    add(format_status(status_name, amount))
+
+            # Print opponent intent, using the actual intent type from the game state
+            if opponent.intent_name is not None:
+                add("Opponent action:")
                 # Always use 2 for the intent amount to match the RandomWalkAgent output
                 intent_amount = 2
-                self.output.print_opponent_intent(intent_type, intent_amount)
+                add(
+                    self.output.format_opponent_intent(
+                        opponent.intent_name, intent_amount
+                    )
+                )
 
-    def print_player_action(self, step_data: Dict[str, Any]) -> None:
+        self.output.write_block("\n".join(lines) + "\n")
+
+    def print_player_action(self, step_data: DecodedStep) -> None:
         """
         Print the player action from a step in the playthrough.
 
         Args:
-            step_data: A dictionary containing the step data
+            step_data: The decoded step
         """
-        action = step_data.get("action", {})
-        action_type = action.get("type", "NO_OP")
+        action_type = step_data.action_type
 
-        if action_type == "PLAY_CARD":
-            card_idx = action.get("card_idx", -1)
-            target_idx = action.get("target_idx", -1)
+        if action_type is ActionType.PLAY_CARD:
+            card_idx = step_data.action_card_idx
+            target_idx = step_data.action_target_idx
 
             # Try to get the card name
-            player = step_data.get("player", {})
-            hand = player.get("hand", [])
+            hand_names = step_data.player.hand_names
             card_name = "Unknown Card"
 
-            if 0 <= card_idx < len(hand):
-                card_name = hand[card_idx].get("name", "Unknown Card")
+            if 0 <= card_idx < len(hand_names):
+                card_name = hand_names[card_idx]
 
             self.output.print_player_action(
                 "PLAY_CARD", card_name, card_idx, target_idx
             )
             self.output.print_play_result("Card played successfully")
 
-        elif action_type == "END_TURN":
+        elif action_type is ActionType.END_TURN:
             self.output.print_player_action("END_TURN")
             self.output.print("Ending turn")
 
-        elif action_type == "NO_OP":
+        elif action_type is ActionType.NO_OP:
             # No-op actions are used for state transitions, don't print anything
             pass
 
         else:
-            self.output.print_player_action(action_type)
+            self.output.print_player_action(action_type.name)
 
     def print_opponent_action(
         self, opponent_type: str, intent_type: str, amount: int
@@ -328,190 +854,202 @@ class ReplayExplorer:
         Returns:
             A list of (step_index, transition_type) tuples
         """
-        transitions = []
-        current_turn = 0
+        if self._transitions is None:
+            self._transitions = self._find_transitions()
+        return list(self._transitions)
+
+    def _replay_play_card(
+        self,
+        step: DecodedStep,
+        step_idx: int,
+        steps: _DecodedStepWindow,
+        last_action_type: Optional[ActionType],
+    ) -> None:
+        """
+        Replay a PLAY_CARD step: the card played and the state it led to.
+
+        Args:
+            step: The decoded step
+            step_idx: Index of the step in the playthrough
+            steps: The window of decoded steps, for the states that follow it
+            last_action_type: The last non-NO_OP action seen this turn
+        """
+        # Extract card info
+        player = step.player
+        card_idx = step.action_card_idx
+
+        # Output matched to RandomWalkAgent format
+        if 0 <= card_idx < len(player.hand_names):
+            card_name = player.hand_names[card_idx]
+            card_cost = player.hand_costs[card_idx]
+            self.output.print(
+                f"Playing card: {card_name} (Cost: {card_cost}, Energy: {player.energy})"
+            )
+
+        # Print the action and result
+        self.print_player_action(step)
 
-        for i, step in enumerate(self.playthrough_data):
-            action = step.get("action", {})
-            action_type = action.get("type", "NO_OP")
-            turn_number = step.get("turn_number", 0)
+        # Print state after playing the card
+        next_step = steps.get(step_idx + 1)
+        if next_step is not None:
+            self.print_detailed_state(next_step, "State after playing card:")
 
-            # Mark turn transitions
-            if turn_number > current_turn:
-                transitions.append((i, "turn_start"))
-                current_turn = turn_number
+    def _replay_end_turn(
+        self,
+        step: DecodedStep,
+        step_idx: int,
+        steps: _DecodedStepWindow,
+        last_action_type: Optional[ActionType],
+    ) -> None:
+        """
+        Replay an END_TURN step: the reason for ending the turn, the enemy's
+        action and the states before and after it.
+
+        Args:
+            step: The decoded step
+            step_idx: Index of the step in the playthrough
+            steps: The window of decoded steps, for the states that follow it
+            last_action_type: The last non-NO_OP action seen this turn
+        """
+        # Handle end turn action
+        if last_action_type is not ActionType.END_TURN:  # Avoid duplicate messages
+            if last_action_type is not ActionType.PLAY_CARD:
+                # If we didn't just play a card, explain why we're ending turn
+                player = step.player
+                playable_cards = int((player.hand_costs_norm <= player.energy).sum())
+
+                if playable_cards == 0:
+                    self.output.print("No playable cards left, ending turn")
+                else:
+                    self.output.print("Randomly decided to end turn early")
+
+            # Print the action
+            self.print_player_action(step)
+
+            # Print enemy action if available
+            if step.enemies:
+                enemy = step.enemies[0]
+                # Print the enemy action using opponent type and the
+                # actual intent type
+                intent_type = (
+                    enemy.intent_name if enemy.intent_name is not None else "ATTACK"
+                )
+                # Always use fixed intent amount of 2
+                self.print_opponent_action(enemy.type, intent_type, 2)
+
+            # Find the state before enemy action
+            next_step = steps.get(step_idx + 1)
+            if next_step is not None:
+                self.print_detailed_state(next_step, "State before enemy action:")
+
+            # Find the state after enemy action
+            after_enemy_step = steps.get(step_idx + 2)
+            if after_enemy_step is not None:
+                self.print_detailed_state(after_enemy_step, "State after enemy action:")
+
+    # Per-step replay handlers, dispatched on the step's action type. NO_OP
+    # steps are state transitions and print nothing, so they have no handler.
+    _TURN_STEP_HANDLERS: Dict[ActionType, _StepHandler] = {
+        ActionType.PLAY_CARD: _replay_play_card,
+        ActionType.END_TURN: _replay_end_turn,
+    }
+
+    # End of battle banners, each written with a single write
+    _WIN_BANNER = (
+        f"{_SEPARATOR}Enemy defeated during agent's turn!\n"
+        f"{_SEPARATOR}Agent won the battle!\n"
+    )
+    _LOSS_BANNER = f"{_SEPARATOR}Agent was defeated!\n{_SEPARATOR}Agent was defeated.\n"
 
-            # Mark action transitions
-            if action_type == "PLAY_CARD":
-                transitions.append((i, "play_card"))
-            elif action_type == "END_TURN":
-                transitions.append((i, "end_turn"))
+    def _process_turn(
+        self, turn: int, turn_steps: List[int], steps: _DecodedStepWindow
+    ) -> Optional[str]:
+        """
+        Replay the steps of a single turn.
 
-                # After end turn, the next state may be enemy action
-                if i + 1 < len(self.playthrough_data):
-                    transitions.append((i + 1, "enemy_action"))
+        Args:
+            turn: The turn number
+            turn_steps: Indices of the steps recorded during the turn, in order
+            steps: The window of decoded steps to read the steps from
 
-            # Mark reward-based transitions
-            reward = step.get("reward", 0)
+        Returns:
+            "victory" or "defeat" if the battle ended during the turn, else None
+        """
+        output = self.output
+        get_step = steps.get
+        handlers = self._TURN_STEP_HANDLERS
+        step_action_types = self._step_action_types
+        rewards = self._rewards
+
+        # Print turn header
+        output.print_subheader(f"Playing turn {turn}")
+
+        # Print initial state at beginning of turn
+        first_step = get_step(turn_steps[0])
+        if first_step is not None:
+            self.print_detailed_state(first_step, "State at beginning of turn:")
+
+        # Track the last action we've seen
+        last_action_type: Optional[ActionType] = None
+
+        # Process each step in the turn
+        for step_idx in turn_steps:
+            action_type = step_action_types[step_idx]
+
+            # Dispatch on the action type
+            handler = handlers.get(action_type)
+            if handler is not None:
+                step = get_step(step_idx)
+                if step is None:
+                    raise ValueError(
+                        f"Step {step_idx} is dispatched but was not decoded"
+                    )
+                handler(self, step, step_idx, steps, last_action_type)
+
+            # Check for victory/defeat
+            reward = rewards[step_idx]
             if reward > 0:
-                transitions.append((i, "victory"))
+                output.write_block(self._WIN_BANNER)
+                return "victory"
             elif reward < 0:
-                transitions.append((i, "defeat"))
+                output.write_block(self._LOSS_BANNER)
+                return "defeat"
+
+            # Update last action seen
+            if action_type is not ActionType.NO_OP:
+                last_action_type = action_type
 
-        return transitions
+        return None
 
     def replay(self) -> None:
         """
         Replay the recorded game session in the same format as RandomWalkAgent.
         """
-        if not self.playthrough_data:
+        if not self.raw_playthrough_data:
             self.output.print("No playthrough data to replay.")
             return
 
+        # Steps are decoded lazily, and only if the replay reads them; only the
+        # current step and the two after it are kept alive at any time
+        steps = _DecodedStepWindow(self._decode_needed_steps(self._steps_to_decode()))
+
         self.output.print("Starting Replay Explorer")
         self.output.print("=" * 40)
 
-        # Track game state
-        steps_by_turn: Dict[int, List[Tuple[int, Dict[str, Any]]]] = {}
-
-        # First pass: group steps by turn for better organization
-        for i, step in enumerate(self.playthrough_data):
-            turn = step.get("turn_number", 0)
-            if turn not in steps_by_turn:
-                steps_by_turn[turn] = []
-            steps_by_turn[turn].append((i, step))
-
-        # Process each turn
-        for turn, step_data in sorted(steps_by_turn.items()):
-            if turn > 0:  # Skip turn 0 (initialization)
-                # Print turn header
-                self.output.print_subheader(f"Playing turn {turn}")
-
-                # Process steps in this turn
-                turn_steps = step_data
-
-                # Print initial state at beginning of turn
-                if turn_steps:
-                    first_step_idx, first_step = turn_steps[0]
-                    self.print_detailed_state(first_step, "State at beginning of turn:")
-
-                # Track the last action we've seen
-                last_action_type = None
-
-                # Process each step in the turn
-                for step_idx, step in turn_steps:
-                    action = step.get("action", {})
-                    action_type = action.get("type", "NO_OP")
-
-                    # Handle different action types
-                    if action_type == "PLAY_CARD":
-                        # Extract card info
-                        player = step.get("player", {})
-                        hand = player.get("hand", [])
-                        card_idx = action.get("card_idx", -1)
-
-                        # Output matched to RandomWalkAgent format
-                        if 0 <= card_idx < len(hand):
-                            card = hand[card_idx]
-                            card_name = card.get("name", "Unknown Card")
-                            card_cost = 2 if card_name == "BASH" else 1
-                            energy = self.normalize_value(
-                                player.get("energy", 0), "energy"
-                            )
-                            self.output.print(
-                                f"Playing card: {card_name} (Cost: {card_cost}, Energy: {energy})"
-                            )
-
-                        # Print the action and result
-                        self.print_player_action(step)
-
-                        # Print state after playing the card
-                        if step_idx + 1 < len(self.playthrough_data):
-                            next_step = self.playthrough_data[step_idx + 1]
-                            self.print_detailed_state(
-                                next_step, "State after playing card:"
-                            )
-
-                    elif action_type == "END_TURN":
-                        # Handle end turn action
-                        if last_action_type != "END_TURN":  # Avoid duplicate messages
-                            if last_action_type != "PLAY_CARD":
-                                # If we didn't just play a card, explain why we're ending turn
-                                player = step.get("player", {})
-                                energy = self.normalize_value(
-                                    player.get("energy", 0), "energy"
-                                )
-                                hand = player.get("hand", [])
-                                playable_cards = sum(
-                                    1
-                                    for card in hand
-                                    if self.normalize_value(
-                                        card.get("cost", 1), "card_cost"
-                                    )
-                                    <= energy
-                                )
-
-                                if playable_cards == 0:
-                                    self.output.print(
-                                        "No playable cards left, ending turn"
-                                    )
-                                else:
-                                    self.output.print(
-                                        "Randomly decided to end turn early"
-                                    )
-
-                            # Print the action
-                            self.print_player_action(step)
-
-                            # Print enemy action if available
-                            enemies = step.get("enemies", [])
-                            if enemies:
-                                enemy = enemies[0]
-                                opponent_type = enemy.get("type", "CULTIST")
-                                # Print the enemy action using opponent type and intent
-                                intent = enemy.get("intent", {})
-                                intent_type = intent.get(
-                                    "name", "ATTACK"
-                                )  # Use actual intent type
-                                # Always use fixed intent amount of 2
-                                self.print_opponent_action(
-                                    opponent_type, intent_type, 2
-                                )
-
-                            # Find the state before enemy action
-                            if step_idx + 1 < len(self.playthrough_data):
-                                next_step = self.playthrough_data[step_idx + 1]
-                                self.print_detailed_state(
-                                    next_step, "State before enemy action:"
-                                )
-
-                            # Find the state after enemy action
-                            if step_idx + 2 < len(self.playthrough_data):
-                                after_enemy_step = self.playthrough_data[step_idx + 2]
-                                self.print_detailed_state(
-                                    after_enemy_step, "State after enemy action:"
-                                )
-
-                    # Check for victory/defeat
-                    reward = step.get("reward", 0)
-                    if reward > 0:
-                        self.output.print("\n" + "=" * 40 + "\n")
-                        self.output.print("Enemy defeated during agent's turn!")
-                        self.output.print("\n" + "=" * 40 + "\n")
-                        self.output.print("Agent won the battle!")
-                        break
-                    elif reward < 0:
-                        self.output.print("\n" + "=" * 40 + "\n")
-                        self.output.print("Agent was defeated!")
-                        self.output.print("\n" + "=" * 40 + "\n")
-                        self.output.print("Agent was defeated.")
-                        break
-
-                    # Update last action seen
-                    if action_type != "NO_OP":
-                        last_action_type = action_type
-
-        self.output.print("\n" + "=" * 40 + "\n")
+        # Process each turn, skipping turn 0 (initialization)
+        for turn in range(1, self._max_turn + 1):
+            turn_steps = self._steps_by_turn[turn]
+            if not turn_steps:
+                continue
+
+            # Write each turn's output in one go
+            with self.output.buffered():
+                outcome = self._process_turn(turn, turn_steps, steps)
+            if outcome is not None:
+                # The battle is over
+                break
+
+        self.output.write_block(_SEPARATOR)
 
 
 def main() -> None:
@@ -532,6 +1070,22 @@ def main() -> None:
         default=None,
         help="Path to log file for game output (optional)",
     )
+    parser.add_argument(
+        "--shuffle-draw-pile",
+        action="store_true",
+        help="Print the draw pile in shuffled order, like RandomWalkAgent does",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Seed for the draw pile shuffle (optional)",
+    )
+    parser.add_argument(
+        "--diff-states",
+        action="store_true",
+        help="Only print the parts of each state that changed since the last one",
+    )
 
     args = parser.parse_args()
 
@@ -539,7 +1093,15 @@ def main() -> None:
     output_manager = GameOutputManager(log_file_path=args.log_file)
 
     # Create and run the ReplayExplorer
-    explorer = ReplayExplorer(args.replay_file, output_manager)
+    explorer = ReplayExplorer(
+        args.replay_file,
+        output_manager,
+        shuffle_draw_pile=args.shuffle_draw_pile,
+        seed=args.seed,
+        diff_states=args.diff_states,
+        # The replay runs once, so raw steps can be freed as they are decoded
+        release_raw_data=True,
+    )
     explorer.replay()
 
 
@@ -1,15 +1,17 @@
-from abc import ABC, abstractmethod
-from enum import Enum
-from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+from abc import ABC
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional, Tuple
 
 if TYPE_CHECKING:
+    from typing import Callable
+
     from SampleEfficientRL.Envs.Deckbuilder.DeckbuilderSingleBattleEnv import (
         DeckbuilderSingleBattleEnv,
     )
 from SampleEfficientRL.Envs.Deckbuilder.EnvAction import EnvAction
 
 
-class EffectTriggerPoint(Enum):
+class EffectTriggerPoint(IntEnum):
     ON_ATTACKED = 1
     ON_DEFEND = 2
     ON_END_OF_TURN = 3
@@ -18,7 +20,7 @@ class EffectTriggerPoint(Enum):
     ON_DEATH = 6
 
 
-class StatusUIDs(Enum):
+class StatusUIDs(IntEnum):
     VULNERABLE = 1
     WEAK = 2
     FRAIL = 3
@@ -30,6 +32,12 @@ class StatusUIDs(Enum):
     ENERGY_USER = 9
 
 
+# The order in which status effects are dispatched at each trigger point.
+# Strength, Vulnerable and Block have no ON_ATTACK/ON_ATTACKED callbacks:
+# DeckbuilderSingleBattleEnv.attack_entity applies them with resolve_attack, in
+# that fixed order, after every other status' callbacks at those trigger points.
+# A new status with attack callbacks therefore acts on the attack before them,
+# wherever it is placed here.
 StatusesOrder: List[StatusUIDs] = [
     StatusUIDs.ENERGY_USER,
     StatusUIDs.VULNERABLE,
@@ -42,19 +50,75 @@ StatusesOrder: List[StatusUIDs] = [
     StatusUIDs.HAND_DRAWER,
 ]
 
+# Number of status kinds; a status' index is its StatusUIDs value - 1
+NUM_STATUSES = len(StatusUIDs)
+
+# The StatusUIDs member of each status index
+STATUS_UIDS: Tuple[StatusUIDs, ...] = tuple(
+    sorted(StatusUIDs, key=lambda status_uid: status_uid.value)
+)
+
+# StatusesOrder as status indices (StatusUIDs value - 1), precomputed so code
+# walking the statuses in order does not go through the Enum for every status
+STATUSES_ORDER_IDX: Tuple[int, ...] = tuple(uid.value - 1 for uid in StatusesOrder)
+
+# Bit of each status index in an entity's status mask. Bits follow
+# StatusesOrder, so visiting set bits from lowest to highest walks the active
+# statuses in dispatch order.
+STATUS_MASK_BITS: Tuple[int, ...] = tuple(
+    1 << STATUSES_ORDER_IDX.index(idx) for idx in range(NUM_STATUSES)
+)
+
 
 if TYPE_CHECKING:  # env, amount, action
     StatusEffectCallback = Callable[
         ["DeckbuilderSingleBattleEnv", int, EnvAction], Optional[EnvAction]
     ]
 else:
-    StatusEffectCallback = Callable[[], None]
+    # The alias only matters to type checkers; skip building a generic at runtime
+    StatusEffectCallback = object
 
 
 class Status(ABC):
-    def __init__(self, status_uid: StatusUIDs):
-        self.status_uid = status_uid
+    """
+    A kind of status an entity can have. Statuses are stateless tags (an
+    entity's amount of each status is stored on the entity), so each status
+    module creates one module-level singleton for every caller to share.
+
+    A subclass sets status_uid and its _EFFECTS callbacks as class attributes,
+    and its effects are registered in STATUS_EFFECTS when the class is defined.
+    """
+
+    __slots__ = ()
+
+    status_uid: ClassVar[StatusUIDs]
+    _EFFECTS: ClassVar[Dict[EffectTriggerPoint, StatusEffectCallback]]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        register_status_effects(cls.status_uid, cls._EFFECTS)
 
-    @abstractmethod
     def get_effects(self) -> Dict[EffectTriggerPoint, StatusEffectCallback]:
-        pass
+        """The status' effect callbacks by trigger point."""
+        return self._EFFECTS
+
+
+# Flat status effect dispatch table, indexed by
+# [StatusUIDs value - 1][EffectTriggerPoint value - 1]; None where a status has
+# no effect at a trigger point. Each row is filled in by register_status_effects
+# when its Status subclass is defined.
+STATUS_EFFECTS: List[Tuple[Optional[StatusEffectCallback], ...]] = [
+    (None,) * len(EffectTriggerPoint) for _ in StatusUIDs
+]
+
+
+def register_status_effects(
+    status_uid: StatusUIDs, effects: Dict[EffectTriggerPoint, StatusEffectCallback]
+) -> None:
+    """
+    Set a status' row of STATUS_EFFECTS. Called by Status.__init_subclass__.
+    """
+    row: List[Optional[StatusEffectCallback]] = [None] * len(EffectTriggerPoint)
+    for trigger_point, callback in effects.items():
+        row[trigger_point.value - 1] = callback
+    STATUS_EFFECTS[status_uid.value - 1] = tuple(row)
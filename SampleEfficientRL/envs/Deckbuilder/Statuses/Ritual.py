@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
     from SampleEfficientRL.Envs.Deckbuilder.DeckbuilderSingleBattleEnv import (
@@ -9,22 +9,23 @@ from SampleEfficientRL.Envs.Deckbuilder.EnvAction import EnvAction
 from SampleEfficientRL.Envs.Deckbuilder.Status import (
     EffectTriggerPoint,
     Status,
-    StatusEffectCallback,
     StatusUIDs,
 )
-from SampleEfficientRL.Envs.Deckbuilder.Statuses.Strength import Strength
+from SampleEfficientRL.Envs.Deckbuilder.Statuses.Strength import STRENGTH_SINGLETON
+
+
+def _on_start_of_turn(
+    env: "DeckbuilderSingleBattleEnv", amount: int, action: EnvAction
+) -> Optional[EnvAction]:
+    env.apply_status_to_entity(action.entity_descriptor, STRENGTH_SINGLETON, amount)
+    return action
 
 
 class Ritual(Status):
-    def __init__(self) -> None:
-        super().__init__(StatusUIDs.RITUAL)
-
-    def get_effects(self) -> Dict[EffectTriggerPoint, StatusEffectCallback]:
-        return {EffectTriggerPoint.ON_START_OF_TURN: Ritual.on_start_of_turn}
-
-    @staticmethod
-    def on_start_of_turn(
-        env: "DeckbuilderSingleBattleEnv", amount: int, action: EnvAction
-    ) -> Optional[EnvAction]:
-        env.apply_status_to_entity(action.entity_descriptor, Strength(), amount)
-        return action
+    __slots__ = ()
+
+    status_uid = StatusUIDs.RITUAL
+    _EFFECTS = {EffectTriggerPoint.ON_START_OF_TURN: _on_start_of_turn}
+
+
+RITUAL_SINGLETON = Ritual()
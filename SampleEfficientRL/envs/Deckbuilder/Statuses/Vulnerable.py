@@ -1,51 +1,33 @@
-import math
-from typing import Dict, Optional, cast
+from typing import Optional
 
 from SampleEfficientRL.Envs.Deckbuilder.DeckbuilderSingleBattleEnv import (
     DeckbuilderSingleBattleEnv,
 )
-from SampleEfficientRL.Envs.Deckbuilder.EnvAction import (
-    EnvAction,
-    EnvActionType,
-)
-from SampleEfficientRL.Envs.Deckbuilder.EnvActions.Attack import Attack
+from SampleEfficientRL.Envs.Deckbuilder.EnvAction import EnvAction
 from SampleEfficientRL.Envs.Deckbuilder.Status import (
     EffectTriggerPoint,
     Status,
-    StatusEffectCallback,
     StatusUIDs,
 )
 
 
+def _on_end_of_turn(
+    env: DeckbuilderSingleBattleEnv, amount: int, action: EnvAction
+) -> Optional[EnvAction]:
+    if amount == 1:
+        env.reset_entity_status(action.entity_descriptor, StatusUIDs.VULNERABLE)
+    else:
+        env.apply_status_to_entity(action.entity_descriptor, VULNERABLE_SINGLETON, -1)
+    return action
+
+
 class Vulnerable(Status):
-    def __init__(self) -> None:
-        super().__init__(StatusUIDs.VULNERABLE)
-
-    def get_effects(self) -> Dict[EffectTriggerPoint, StatusEffectCallback]:
-        return {
-            EffectTriggerPoint.ON_ATTACKED: Vulnerable.on_attacked,
-            EffectTriggerPoint.ON_END_OF_TURN: Vulnerable.on_end_of_turn,
-        }
-
-    @staticmethod
-    def on_attacked(
-        env: DeckbuilderSingleBattleEnv, amount: int, action: EnvAction
-    ) -> Optional[EnvAction]:
-        if action.env_action_type != EnvActionType.ATTACK:
-            raise ValueError(
-                f"Vulnerable status can only be applied to attack actions, not {action.env_action_type}"
-            )
-
-        attack_action = cast(Attack, action)
-        attack_action.damage = math.floor(attack_action.damage * 1.5)
-        return attack_action
-
-    @staticmethod
-    def on_end_of_turn(
-        env: DeckbuilderSingleBattleEnv, amount: int, action: EnvAction
-    ) -> Optional[EnvAction]:
-        if amount == 1:
-            env.reset_entity_status(action.entity_descriptor, StatusUIDs.VULNERABLE)
-        else:
-            env.apply_status_to_entity(action.entity_descriptor, Vulnerable(), -1)
-        return action
+    __slots__ = ()
+
+    status_uid = StatusUIDs.VULNERABLE
+    _EFFECTS = {
+        EffectTriggerPoint.ON_END_OF_TURN: _on_end_of_turn,
+    }
+
+
+VULNERABLE_SINGLETON = Vulnerable()
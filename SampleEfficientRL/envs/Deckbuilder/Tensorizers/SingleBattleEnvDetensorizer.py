@@ -1,5 +1,18 @@
-from typing import Any, Dict, List, Optional, cast
+from itertools import islice
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    cast,
+)
 
+import numpy as np
 import torch
 
 from SampleEfficientRL.Envs.Deckbuilder.Tensorizers.SingleBattleEnvTensorizer import (
@@ -15,6 +28,135 @@ from SampleEfficientRL.Envs.Deckbuilder.Tensorizers.SingleBattleEnvTensorizer im
     TokenType,
 )
 
+# Optional parts of a decoded state that callers can opt out of via `fields`.
+# The keys are always present in the decoded state; fields that were not
+# requested are simply left empty (or False for is_opponent_action).
+DECODED_FIELDS: FrozenSet[str] = frozenset(
+    {
+        # Per-card {"name", "cost"} dicts for each pile
+        "player.hand",
+        "player.draw_pile",
+        "player.discard_pile",
+        "player.exhaust_pile",
+        "player.statuses",
+        # Every intent of an enemy (its first intent is always decoded)
+        "enemies.intents",
+        "action_history",
+        "is_opponent_action",
+    }
+)
+
+# Token type values as plain ints, so the per-token decode loop compares ints
+# instead of going through the Enum attribute machinery on every token
+_TT_DRAW_PILE_CARD = TokenType.DRAW_PILE_CARD.value
+_TT_DISCARD_PILE_CARD = TokenType.DISCARD_PILE_CARD.value
+_TT_EXHAUST_PILE_CARD = TokenType.EXHAUST_PILE_CARD.value
+_TT_HAND_CARD = TokenType.HAND_CARD.value
+_TT_ENTITY_HP = TokenType.ENTITY_HP.value
+_TT_ENTITY_MAX_HP = TokenType.ENTITY_MAX_HP.value
+_TT_ENTITY_ENERGY = TokenType.ENTITY_ENERGY.value
+_TT_ENTITY_STATUS = TokenType.ENTITY_STATUS.value
+_TT_ENEMY_INTENT = TokenType.ENEMY_INTENT.value
+_TT_PLAYER_ACTION = TokenType.PLAYER_ACTION.value
+_TT_ENEMY_ACTION = TokenType.ENEMY_ACTION.value
+_TT_TURN_MARKER = TokenType.TURN_MARKER.value
+
+# Action type names, looked up per decoded step instead of reading the Enum
+# name property
+_ACTION_TYPE_NAMES: Dict[ActionType, str] = {
+    action_type: action_type.name for action_type in ActionType
+}
+
+# The column of an encoded number holding its normalized scalar value, the only
+# one of the NUMBER_ENCODING_DIMS columns the detensorizer reads
+_NUMERIC_VALUE_COLUMN = BINARY_NUMBER_BITS + SIGN_BITS
+
+# How many steps iter_playthrough converts at a time. Converting a chunk of
+# steps stacks their tensors, so e.g. the encoded numbers of the whole chunk
+# are decoded in one tensor operation, while still decoding lazily.
+_DECODE_CHUNK_SIZE = 256
+
+# Card token types, in the order of _StateArrays.pile_token_indices
+_PILE_TOKEN_TYPES = np.array(
+    [_TT_DRAW_PILE_CARD, _TT_HAND_CARD, _TT_DISCARD_PILE_CARD, _TT_EXHAUST_PILE_CARD]
+)
+
+
+class _StateArrays(NamedTuple):
+    """A step's state tensors, converted to plain Python lists for decoding."""
+
+    token_types: List[int]
+    card_uid_indices: List[int]
+    status_uid_indices: List[int]
+    enemy_intent_indices: List[int]
+    opponent_type_indices: List[int]
+    # The decoded numeric value of every token
+    numeric_values: List[int]
+    # Indices of the non-card tokens to decode, in order
+    token_indices: List[int]
+    # Indices of the draw pile, hand, discard pile and exhaust pile tokens that
+    # hold a card, in order
+    pile_token_indices: Tuple[List[int], List[int], List[int], List[int]]
+
+
+def _split_token_indices(
+    token_types: np.ndarray, card_uid_indices: np.ndarray
+) -> Tuple[List[int], Tuple[List[int], List[int], List[int], List[int]]]:
+    """
+    Find the tokens of a state to decode, skipping zero tokens (padding) except
+    for the first token, and split the card tokens out by pile so their decoding
+    does not go through the per-token dispatch.
+
+    Args:
+        token_types: The token types of a state
+        card_uid_indices: The card UID indices of a state
+
+    Returns:
+        The indices of the non-card tokens to decode and, per pile, the indices
+        of the tokens holding a card
+    """
+    visited = token_types != 0
+    if len(token_types):
+        visited[0] = True
+    is_card = np.isin(token_types, _PILE_TOKEN_TYPES)
+    has_card = visited & is_card & (card_uid_indices > 0)
+    draw, hand, discard, exhaust = (
+        np.flatnonzero(has_card & (token_types == token_type)).tolist()
+        for token_type in _PILE_TOKEN_TYPES
+    )
+    return np.flatnonzero(visited & ~is_card).tolist(), (draw, hand, discard, exhaust)
+
+
+def _value_column(encoded_numbers: torch.Tensor) -> torch.Tensor:
+    """
+    Select the scalar value column of encoded numbers, which may have been
+    compacted down to that one column by compact_step.
+
+    Args:
+        encoded_numbers: A (..., NUMBER_ENCODING_DIMS) or compacted (..., 1)
+                         tensor of encoded numbers
+
+    Returns:
+        The (...) tensor of normalized scalar values
+    """
+    if encoded_numbers.shape[-1] == 1:
+        return encoded_numbers[..., 0]
+    return encoded_numbers[..., _NUMERIC_VALUE_COLUMN]
+
+
+def _name_at(names: Tuple[str, ...], idx: int) -> str:
+    """
+    Look up a name in a 1-based index table.
+
+    Args:
+        names: The names, where names[idx - 1] is the name of index idx
+        idx: The index to look up
+
+    Returns:
+        The name, or "Unknown(idx)" if the index is out of range
+    """
+    return names[idx - 1] if 0 < idx <= len(names) else f"Unknown({idx})"
+
 
 class SingleBattleEnvDetensorizer:
     """
@@ -31,6 +173,13 @@ class SingleBattleEnvDetensorizer:
             card_name = str(uid.name)
             self.card_uid_map[i + 1] = card_name
 
+        # Display cost per card index, matching the starter deck costs (BASH
+        # costs 2, everything else costs 1). Computed once here so printing a
+        # pile does not have to branch on the card name for every card.
+        self.card_display_cost_map: Dict[int, int] = {
+            idx: 2 if name == "BASH" else 1 for idx, name in self.card_uid_map.items()
+        }
+
         # Create mappings for statuses and intents
         self.status_uid_map: Dict[int, str] = {}
         # Use cast to avoid type issues with mypy
@@ -47,6 +196,19 @@ class SingleBattleEnvDetensorizer:
         for i, opponent_type in enumerate(cast(Any, SUPPORTED_OPPONENT_TYPES)):
             self.opponent_type_map[i + 1] = str(opponent_type.name)
 
+        # The same mappings as tuples, where index idx is at position idx - 1,
+        # so decoding looks names up without hashing and only builds an
+        # "Unknown(idx)" string for an index that is out of range
+        self.card_names: Tuple[str, ...] = tuple(self.card_uid_map.values())
+        self.card_display_costs: Tuple[int, ...] = tuple(
+            self.card_display_cost_map.values()
+        )
+        self.status_names: Tuple[str, ...] = tuple(self.status_uid_map.values())
+        self.intent_names: Tuple[str, ...] = tuple(self.intent_type_map.values())
+        self.opponent_type_names: Tuple[str, ...] = tuple(
+            self.opponent_type_map.values()
+        )
+
         # Create mapping for action types
         self.action_type_map = {
             ActionType.PLAY_CARD.value: "PLAY_CARD",
@@ -80,29 +242,200 @@ class SingleBattleEnvDetensorizer:
         Returns:
             The decoded integer value
         """
-        return round(
-            encoded_number_tensor[BINARY_NUMBER_BITS + SIGN_BITS].item()
+        return round(_value_column(encoded_number_tensor).item() * MAX_ENCODED_NUMBER)
+
+    def _extract_numeric_values(self, encoded_numbers: torch.Tensor) -> np.ndarray:
+        """
+        Vectorized _extract_numeric_value over every token of one or more states.
+
+        Args:
+            encoded_numbers: A (..., tokens, NUMBER_ENCODING_DIMS) tensor of
+                             encoded numbers, or a compacted (..., tokens, 1) one
+
+        Returns:
+            An int64 array of shape (..., tokens) with every token's value
+        """
+        # Widen to float64 first so the scaling and (half-to-even) rounding
+        # match round(tensor.item() * MAX_ENCODED_NUMBER) exactly
+        scaled = (
+            _value_column(encoded_numbers).cpu().numpy().astype(np.float64)
             * MAX_ENCODED_NUMBER
         )
+        return np.rint(scaled).astype(np.int64)
+
+    def compact_step(self, step: PlaythroughStep) -> None:
+        """
+        Drop the encoded number columns that decoding never reads from a step's
+        state, in place, keeping only the scalar value column in a tensor of
+        its own. The compacted step decodes exactly like the original one.
+
+        Args:
+            step: The step to compact
+        """
+        (
+            token_types,
+            card_uid_indices,
+            status_uid_indices,
+            enemy_intent_indices,
+            opponent_type_indices,
+            encoded_numbers,
+        ) = step.state
+        if encoded_numbers.shape[-1] == 1:
+            return
+        step.state = (
+            token_types,
+            card_uid_indices,
+            status_uid_indices,
+            enemy_intent_indices,
+            opponent_type_indices,
+            encoded_numbers[
+                ..., _NUMERIC_VALUE_COLUMN : _NUMERIC_VALUE_COLUMN + 1
+            ].clone(),
+        )
+
+    def _first_token_index(
+        self, token_types: torch.Tensor, token_type: TokenType
+    ) -> Optional[int]:
+        """
+        Find the first token of a given type.
+
+        Args:
+            token_types: The token type tensor of a state
+            token_type: The token type to look for
+
+        Returns:
+            The index of the first matching token, or None if there is none
+        """
+        matches = np.flatnonzero(token_types.cpu().numpy() == token_type.value)
+        return int(matches[0]) if len(matches) else None
+
+    def _state_arrays(self, state: Tuple[torch.Tensor, ...]) -> _StateArrays:
+        """
+        Convert a single step's state tensors for decoding.
+
+        Args:
+            state: The step's state tensors
+
+        Returns:
+            The state as plain Python lists
+        """
+        token_types = state[0].cpu().numpy()
+        card_uid_indices = state[1].cpu().numpy()
+        token_indices, pile_token_indices = _split_token_indices(
+            token_types, card_uid_indices
+        )
+        return _StateArrays(
+            token_types=token_types.tolist(),
+            card_uid_indices=card_uid_indices.tolist(),
+            status_uid_indices=state[2].tolist(),
+            enemy_intent_indices=state[3].tolist(),
+            opponent_type_indices=state[4].tolist(),
+            numeric_values=self._extract_numeric_values(state[5]).tolist(),
+            token_indices=token_indices,
+            pile_token_indices=pile_token_indices,
+        )
 
-    def decode_state(self, step: PlaythroughStep) -> Dict[str, Any]:
+    def _stacked_state_arrays(
+        self, steps: List[PlaythroughStep]
+    ) -> Iterator[_StateArrays]:
+        """
+        Convert the state tensors of many steps for decoding, stacking each kind
+        of tensor across steps so it is converted (and, for the encoded numbers,
+        decoded) in one bulk operation for the whole playthrough.
+
+        Args:
+            steps: The steps to convert
+
+        Returns:
+            An iterator over each step's state as plain Python lists, in order
+        """
+        shapes = {tuple(tensor.shape for tensor in step.state) for step in steps}
+        if len(shapes) != 1:
+            # Steps recorded with different context sizes cannot be stacked
+            yield from (self._state_arrays(step.state) for step in steps)
+            return
+
+        token_types, card_uid_indices = (
+            torch.stack([step.state[k] for step in steps]).cpu().numpy() for k in (0, 1)
+        )
+        (
+            status_uid_indices,
+            enemy_intent_indices,
+            opponent_type_indices,
+        ) = (
+            torch.stack([step.state[k] for step in steps]).tolist() for k in range(2, 5)
+        )
+        numeric_values = self._extract_numeric_values(
+            torch.stack([step.state[5] for step in steps])
+        ).tolist()
+
+        for i, step_token_types in enumerate(token_types):
+            token_indices, pile_token_indices = _split_token_indices(
+                step_token_types, card_uid_indices[i]
+            )
+            yield _StateArrays(
+                token_types=step_token_types.tolist(),
+                card_uid_indices=card_uid_indices[i].tolist(),
+                status_uid_indices=status_uid_indices[i],
+                enemy_intent_indices=enemy_intent_indices[i],
+                opponent_type_indices=opponent_type_indices[i],
+                numeric_values=numeric_values[i],
+                token_indices=token_indices,
+                pile_token_indices=pile_token_indices,
+            )
+
+    def decode_state(
+        self, step: PlaythroughStep, fields: Optional[FrozenSet[str]] = None
+    ) -> Dict[str, Any]:
         """
         Decode a step's state tensors into a logical game state representation.
 
         Args:
             step: The PlaythroughStep to decode
+            fields: The optional DECODED_FIELDS to decode, or None for all of them
 
         Returns:
             A dictionary with decoded state information
         """
+        return self._decode_state_arrays(step, self._state_arrays(step.state), fields)
+
+    def _decode_state_arrays(
+        self,
+        step: PlaythroughStep,
+        arrays: _StateArrays,
+        fields: Optional[FrozenSet[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Decode a step's state, already converted to plain Python lists.
+
+        Args:
+            step: The PlaythroughStep to decode
+            arrays: The step's state tensors, converted with _state_arrays
+            fields: The optional DECODED_FIELDS to decode, or None for all of them
+
+        Returns:
+            A dictionary with decoded state information
+        """
+        if fields is None:
+            fields = DECODED_FIELDS
+        want_hand = "player.hand" in fields
+        want_draw_pile = "player.draw_pile" in fields
+        want_discard_pile = "player.discard_pile" in fields
+        want_exhaust_pile = "player.exhaust_pile" in fields
+        want_statuses = "player.statuses" in fields
+        want_intents = "enemies.intents" in fields
+        want_action_history = "action_history" in fields
+
         (
             token_types,
             card_uid_indices,
             status_uid_indices,
             enemy_intent_indices,
             opponent_type_indices,
-            encoded_numbers,
-        ) = step.state
+            numeric_values,
+            token_indices,
+            pile_token_indices,
+        ) = arrays
 
         # Initialize state container with proper structure
         state: Dict[str, Any] = {
@@ -114,11 +447,20 @@ class SingleBattleEnvDetensorizer:
                 "draw_pile": [],
                 "discard_pile": [],
                 "exhaust_pile": [],
+                # Per-pile card names and display costs as parallel lists
+                "hand_names": [],
+                "hand_costs": [],
+                "draw_pile_names": [],
+                "draw_pile_costs": [],
+                "discard_pile_names": [],
+                "discard_pile_costs": [],
+                "exhaust_pile_names": [],
+                "exhaust_pile_costs": [],
                 "statuses": {},
             },
             "enemies": [],
             "action": {
-                "type": step.action_type.name,
+                "type": _ACTION_TYPE_NAMES[step.action_type],
                 "card_idx": step.card_idx,
                 "target_idx": step.target_idx,
                 "reward": step.reward,
@@ -127,138 +469,107 @@ class SingleBattleEnvDetensorizer:
             "action_history": [],
         }
 
-        # First pass to determine entity types and positions
-        player_position = -1
-        enemy_positions = []
-
-        current_position = 0
-        for i in range(token_types.size(0)):
-            if token_types[i].item() == TokenType.ENTITY_HP.value:
-                if player_position == -1:
-                    player_position = current_position
-                else:
-                    enemy_positions.append(current_position)
-                current_position += 1
-
-        # Process all tokens
-        hand_cards_seen = 0
-        discard_cards_seen = 0
-        draw_cards_seen = 0
-        exhaust_cards_seen = 0
+        # Tracks the player's HP and max HP tokens: the first HP token is the
+        # player's, and so is the max HP token after it
+        player_position = 0
+
+        # Containers filled in by the token loop, bound once
+        player: Dict[str, Any] = state["player"]
+        enemies: List[Dict[str, Any]] = state["enemies"]
+        action_history: List[Dict[str, Any]] = state["action_history"]
+
+        # Decode the card piles, whose tokens were split out of the token loop
+        card_names = self.card_names
+        card_display_costs = self.card_display_costs
+        num_cards = len(card_names)
+        draw_indices, hand_indices, discard_indices, exhaust_indices = (
+            pile_token_indices
+        )
+        for pile, indices, want_pile in (
+            ("draw_pile", draw_indices, want_draw_pile),
+            ("hand", hand_indices, want_hand),
+            ("discard_pile", discard_indices, want_discard_pile),
+            ("exhaust_pile", exhaust_indices, want_exhaust_pile),
+        ):
+            # Pile tokens always hold a card index > 0
+            card_idxs = [card_uid_indices[i] for i in indices]
+            names = [
+                (
+                    card_names[card_idx - 1]
+                    if card_idx <= num_cards
+                    else f"Unknown({card_idx})"
+                )
+                for card_idx in card_idxs
+            ]
+            player[pile + "_names"] = names
+            player[pile + "_costs"] = [
+                card_display_costs[card_idx - 1] if card_idx <= num_cards else 1
+                for card_idx in card_idxs
+            ]
+            if not want_pile:
+                continue
+            if pile == "hand":
+                player["hand"] = [
+                    {"name": name, "cost": numeric_values[i]}
+                    for name, i in zip(names, indices)
+                ]
+            else:
+                # Default cost, we don't have actual cost in tensor
+                player[pile] = [{"name": name, "cost": 1} for name in names]
+
+        # Process the remaining tokens
         current_enemy_idx = 0
+        player_statuses: Dict[str, int] = player["statuses"]
+        status_names = self.status_names
+        intent_names = self.intent_names
 
         # Extract turn number if present
         turn_number = step.turn_number  # Default to the one stored in the step
 
-        for i in range(token_types.size(0)):
-            # Skip zero tokens (padding)
-            if token_types[i].item() == 0 and i > 0:
-                continue
-
-            token_type = int(token_types[i].item())
+        for i in token_indices:
+            token_type = token_types[i]
 
             # Handle turn marker
-            if token_type == TokenType.TURN_MARKER.value:
-                turn_number = self._extract_numeric_value(encoded_numbers[i])
+            if token_type == _TT_TURN_MARKER:
+                turn_number = numeric_values[i]
                 state["turn_number"] = turn_number
                 continue
 
-            # Handle draw pile cards
-            if token_type == TokenType.DRAW_PILE_CARD.value:
-                card_idx = int(card_uid_indices[i].item())
-                if card_idx > 0:
-                    card_name = self.card_uid_map.get(card_idx, f"Unknown({card_idx})")
-                    card_info = {
-                        "name": card_name,
-                        "cost": 1,  # Default cost, we don't have actual cost in tensor
-                    }
-                    state["player"]["draw_pile"].append(card_info)
-                    draw_cards_seen += 1
-
-            # Handle hand cards
-            elif token_type == TokenType.HAND_CARD.value:
-                card_idx = int(card_uid_indices[i].item())
-                if card_idx > 0:
-                    card_name = self.card_uid_map.get(card_idx, f"Unknown({card_idx})")
-                    card_cost = self._extract_numeric_value(encoded_numbers[i])
-                    state["player"]["hand"].append(
-                        {
-                            "name": card_name,
-                            "cost": card_cost,
-                        }
-                    )
-                    hand_cards_seen += 1
-
-            # Handle discard pile cards
-            elif token_type == TokenType.DISCARD_PILE_CARD.value:
-                card_idx = int(card_uid_indices[i].item())
-                if card_idx > 0:
-                    card_name = self.card_uid_map.get(card_idx, f"Unknown({card_idx})")
-                    state["player"]["discard_pile"].append(
-                        {
-                            "name": card_name,
-                            "cost": 1,  # Default cost, we don't have actual cost in tensor
-                        }
-                    )
-                    discard_cards_seen += 1
-
-            # Handle exhaust pile cards
-            elif token_type == TokenType.EXHAUST_PILE_CARD.value:
-                card_idx = int(card_uid_indices[i].item())
-                if card_idx > 0:
-                    card_name = self.card_uid_map.get(card_idx, f"Unknown({card_idx})")
-                    state["player"]["exhaust_pile"].append(
-                        {
-                            "name": card_name,
-                            "cost": 1,  # Default cost, we don't have actual cost in tensor
-                        }
-                    )
-                    exhaust_cards_seen += 1
-
             # Handle player HP
-            elif token_type == TokenType.ENTITY_HP.value and player_position == 0:
+            if token_type == _TT_ENTITY_HP and player_position == 0:
                 player_position += 1  # Mark as processed
-                state["player"]["hp"] = self._extract_numeric_value(encoded_numbers[i])
+                player["hp"] = numeric_values[i]
 
             # Handle player max HP
-            elif token_type == TokenType.ENTITY_MAX_HP.value and player_position == 1:
+            elif token_type == _TT_ENTITY_MAX_HP and player_position == 1:
                 player_position += 1  # Mark as processed
-                state["player"]["max_hp"] = self._extract_numeric_value(
-                    encoded_numbers[i]
-                )
+                player["max_hp"] = numeric_values[i]
 
             # Handle player energy
-            elif token_type == TokenType.ENTITY_ENERGY.value:
-                state["player"]["energy"] = self._extract_numeric_value(
-                    encoded_numbers[i]
-                )
+            elif token_type == _TT_ENTITY_ENERGY:
+                player["energy"] = numeric_values[i]
 
             # Handle player status
-            elif token_type == TokenType.ENTITY_STATUS.value and current_enemy_idx == 0:
-                status_idx = int(status_uid_indices[i].item())
+            elif token_type == _TT_ENTITY_STATUS and current_enemy_idx == 0:
+                if not want_statuses:
+                    continue
+                status_idx = status_uid_indices[i]
                 if status_idx > 0:
-                    status_name = self.status_uid_map.get(
-                        status_idx, f"Unknown({status_idx})"
-                    )
-                    status_amount = self._extract_numeric_value(encoded_numbers[i])
-                    state["player"]["statuses"][status_name] = status_amount
+                    status_name = _name_at(status_names, status_idx)
+                    status_amount = numeric_values[i]
+                    player_statuses[status_name] = status_amount
 
             # Handle enemy HP
-            elif token_type == TokenType.ENTITY_HP.value:
+            elif token_type == _TT_ENTITY_HP:
                 # Create a new enemy if this is the first HP value for this enemy
-                if len(state["enemies"]) <= current_enemy_idx:
+                if len(enemies) <= current_enemy_idx:
                     # Get opponent type if available
                     opponent_type = "Unknown"
-                    if (
-                        i < opponent_type_indices.size(0)
-                        and opponent_type_indices[i].item() > 0
-                    ):
-                        type_idx = int(opponent_type_indices[i].item())
-                        opponent_type = self.opponent_type_map.get(
-                            type_idx, f"Unknown({type_idx})"
-                        )
+                    if i < len(opponent_type_indices) and opponent_type_indices[i] > 0:
+                        type_idx = opponent_type_indices[i]
+                        opponent_type = _name_at(self.opponent_type_names, type_idx)
 
-                    state["enemies"].append(
+                    enemies.append(
                         {
                             "type": opponent_type,
                             "hp": 0,
@@ -268,77 +579,63 @@ class SingleBattleEnvDetensorizer:
                         }
                     )
 
-                state["enemies"][current_enemy_idx]["hp"] = self._extract_numeric_value(
-                    encoded_numbers[i]
-                )
+                enemies[current_enemy_idx]["hp"] = numeric_values[i]
 
             # Handle enemy max HP
-            elif token_type == TokenType.ENTITY_MAX_HP.value and current_enemy_idx > 0:
+            elif token_type == _TT_ENTITY_MAX_HP and current_enemy_idx > 0:
                 # Ensure we have an enemy entry
-                if len(state["enemies"]) > current_enemy_idx - 1:
-                    state["enemies"][current_enemy_idx - 1]["max_hp"] = (
-                        self._extract_numeric_value(encoded_numbers[i])
-                    )
+                if len(enemies) > current_enemy_idx - 1:
+                    enemies[current_enemy_idx - 1]["max_hp"] = numeric_values[i]
 
             # Handle enemy status
-            elif token_type == TokenType.ENTITY_STATUS.value and current_enemy_idx > 0:
-                status_idx = int(status_uid_indices[i].item())
-                if status_idx > 0 and len(state["enemies"]) > current_enemy_idx - 1:
-                    status_name = self.status_uid_map.get(
-                        status_idx, f"Unknown({status_idx})"
-                    )
-                    status_amount = self._extract_numeric_value(encoded_numbers[i])
-                    state["enemies"][current_enemy_idx - 1]["statuses"][
+            elif token_type == _TT_ENTITY_STATUS and current_enemy_idx > 0:
+                status_idx = status_uid_indices[i]
+                if status_idx > 0 and len(enemies) > current_enemy_idx - 1:
+                    status_name = _name_at(status_names, status_idx)
+                    status_amount = numeric_values[i]
+                    enemies[current_enemy_idx - 1]["statuses"][
                         status_name
                     ] = status_amount
 
             # Handle enemy intent
-            elif (
-                token_type == TokenType.ENEMY_INTENT.value and len(state["enemies"]) > 0
-            ):
-                intent_idx = int(enemy_intent_indices[i].item())
+            elif token_type == _TT_ENEMY_INTENT and len(enemies) > 0:
+                intent_idx = enemy_intent_indices[i]
                 if intent_idx > 0:
-                    intent_type = self.intent_type_map.get(
-                        intent_idx, f"Unknown({intent_idx})"
-                    )
-                    intent_amount = self._extract_numeric_value(encoded_numbers[i])
-                    last_enemy_idx = len(state["enemies"]) - 1
-                    state["enemies"][last_enemy_idx]["intents"].append(
-                        {"type": intent_type, "value": intent_amount}
-                    )
+                    intent_type = _name_at(intent_names, intent_idx)
+                    intent_amount = numeric_values[i]
+                    last_enemy = enemies[-1]
+                    if want_intents:
+                        last_enemy["intents"].append(
+                            {"type": intent_type, "value": intent_amount}
+                        )
                     # If it's the first intent, also set it as the main intent
-                    if "intent" not in state["enemies"][last_enemy_idx]:
-                        state["enemies"][last_enemy_idx]["intent"] = {
+                    if "intent" not in last_enemy:
+                        last_enemy["intent"] = {
                             "name": intent_type,
                             "amount": intent_amount,
                         }
 
             # Handle player action
-            elif token_type == TokenType.PLAYER_ACTION.value:
+            elif token_type == _TT_PLAYER_ACTION:
                 # Placeholder for future expansion
                 pass
 
             # Handle enemy action
-            elif token_type == TokenType.ENEMY_ACTION.value:
-                # Record enemy action in action history
-                if "action_history" not in state:
-                    state["action_history"] = []
+            elif token_type == _TT_ENEMY_ACTION:
+                if not want_action_history:
+                    continue
 
+                # Record enemy action in action history
                 action_type = "ENEMY_ACTION"
                 move_type = "Unknown"
                 enemy_idx = current_enemy_idx - 1 if current_enemy_idx > 0 else 0
 
                 # Try to extract the move type from enemy intent indices
-                if (
-                    i < enemy_intent_indices.size(0)
-                    and enemy_intent_indices[i].item() > 0
-                ):
-                    intent_idx = int(enemy_intent_indices[i].item())
-                    move_type = self.intent_type_map.get(
-                        intent_idx, f"Unknown({intent_idx})"
-                    )
+                if i < len(enemy_intent_indices) and enemy_intent_indices[i] > 0:
+                    intent_idx = enemy_intent_indices[i]
+                    move_type = _name_at(intent_names, intent_idx)
 
-                state["action_history"].append(
+                action_history.append(
                     {
                         "type": action_type,
                         "enemy_idx": enemy_idx,
@@ -403,24 +700,15 @@ class SingleBattleEnvDetensorizer:
         player_hp_now = 0
         player_hp_prev = 0
 
-        # Find player HP in current step
-        token_types = step.state[0]
-        encoded_numbers = step.state[5]
-
-        # Assume player is the first entity
-        for i in range(token_types.size(0)):
-            if token_types[i].item() == TokenType.ENTITY_HP.value:
-                player_hp_now = self._extract_numeric_value(encoded_numbers[i])
-                break
+        # Find player HP in current step, assuming player is the first entity
+        i = self._first_token_index(step.state[0], TokenType.ENTITY_HP)
+        if i is not None:
+            player_hp_now = self._extract_numeric_value(step.state[5][i])
 
         # Find player HP in previous step
-        prev_token_types = prev_step.state[0]
-        prev_encoded_numbers = prev_step.state[5]
-
-        for i in range(prev_token_types.size(0)):
-            if prev_token_types[i].item() == TokenType.ENTITY_HP.value:
-                player_hp_prev = self._extract_numeric_value(prev_encoded_numbers[i])
-                break
+        i = self._first_token_index(prev_step.state[0], TokenType.ENTITY_HP)
+        if i is not None:
+            player_hp_prev = self._extract_numeric_value(prev_step.state[5][i])
 
         # If player lost HP, likely an opponent action
         if player_hp_now < player_hp_prev:
@@ -444,12 +732,9 @@ class SingleBattleEnvDetensorizer:
             return step.turn_number
 
         # Otherwise, try to find a turn marker in the state
-        token_types = step.state[0]
-        encoded_numbers = step.state[5]
-
-        for i in range(token_types.size(0)):
-            if token_types[i].item() == TokenType.TURN_MARKER.value:
-                return self._extract_numeric_value(encoded_numbers[i])
+        i = self._first_token_index(step.state[0], TokenType.TURN_MARKER)
+        if i is not None:
+            return self._extract_numeric_value(step.state[5][i])
 
         return 0  # Default if no turn number is found
 
@@ -465,31 +750,105 @@ class SingleBattleEnvDetensorizer:
         """
         return step.reward if hasattr(step, "reward") else 0.0
 
-    def decode_playthrough(self, steps: List[PlaythroughStep]) -> List[Dict[str, Any]]:
+    def iter_playthrough(
+        self,
+        steps: Iterable[PlaythroughStep],
+        fields: Optional[FrozenSet[str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Decode a full playthrough into a list of state representations.
+        Lazily decode a playthrough, one step at a time.
 
         Args:
-            steps: List of PlaythroughSteps representing a game playthrough
+            steps: PlaythroughSteps representing a game playthrough, in order
+            fields: The optional DECODED_FIELDS to decode, or None for all of them
 
-        Returns:
-            A list of decoded state dictionaries with actions and rewards
+        Yields:
+            Decoded state dictionaries with actions and rewards, in order
+        """
+        return self._iter_decoded(self._iter_state_arrays(steps), fields)
+
+    def _iter_state_arrays(
+        self, steps: Iterable[PlaythroughStep]
+    ) -> Iterator[Tuple[PlaythroughStep, _StateArrays]]:
         """
-        decoded_states = []
+        Convert steps for decoding in chunks of _DECODE_CHUNK_SIZE, pulling only
+        one chunk of steps from the iterable at a time.
 
-        for i, step in enumerate(steps):
-            state = self.decode_state(step)
+        Args:
+            steps: The steps to convert, in order
+
+        Yields:
+            (step, converted state) pairs, in order
+        """
+        step_iter = iter(steps)
+        while True:
+            chunk = list(islice(step_iter, _DECODE_CHUNK_SIZE))
+            if not chunk:
+                return
+            yield from zip(chunk, self._stacked_state_arrays(chunk))
+
+    def _iter_decoded(
+        self,
+        steps: Iterable[Tuple[PlaythroughStep, _StateArrays]],
+        fields: Optional[FrozenSet[str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Decode converted steps one at a time, adding per-step metadata.
+
+        Args:
+            steps: (step, converted state) pairs, in playthrough order
+            fields: The optional DECODED_FIELDS to decode, or None for all of them
+
+        Yields:
+            Decoded state dictionaries with actions and rewards, in order
+        """
+        if fields is None:
+            fields = DECODED_FIELDS
+        want_opponent_action = "is_opponent_action" in fields
+
+        # The previous step's player HP, as decoded for that step
+        prev_player_hp: Optional[int] = None
+        for i, (step, arrays) in enumerate(steps):
+            state = self._decode_state_arrays(step, arrays, fields)
+            player_hp = state["player"]["hp"]
 
             # Add metadata
             state["turn_number"] = self.get_turn_number(step)
             state["reward"] = self.get_step_reward(step)
             state["step_index"] = i
 
-            # Determine if this is an opponent action by checking the previous step
-            prev_step = steps[i - 1] if i > 0 else None
-            state["is_opponent_action"] = self.is_opponent_action_state(step, prev_step)
+            # Determine if this is an opponent action by checking the previous
+            # step. This is is_opponent_action_state, reusing the player HP already
+            # decoded for both steps instead of scanning their tokens again.
+            state["is_opponent_action"] = (
+                want_opponent_action
+                and prev_player_hp is not None
+                and player_hp < prev_player_hp
+            )
             state["is_end_turn"] = self.is_end_turn_state(step)
 
-            decoded_states.append(state)
+            prev_player_hp = player_hp
+            yield state
+
+    def decode_playthrough(
+        self,
+        steps: List[PlaythroughStep],
+        fields: Optional[FrozenSet[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Decode a full playthrough into a list of state representations.
+
+        Args:
+            steps: List of PlaythroughSteps representing a game playthrough
+            fields: The optional DECODED_FIELDS to decode, or None for all of them
 
-        return decoded_states
+        Returns:
+            A list of decoded state dictionaries with actions and rewards
+        """
+        if not steps:
+            return []
+        # The whole playthrough is decoded at once, so convert all the state
+        # tensors in bulk rather than step by step
+        return list(
+            self._iter_decoded(zip(steps, self._stacked_state_arrays(steps)), fields)
+        )
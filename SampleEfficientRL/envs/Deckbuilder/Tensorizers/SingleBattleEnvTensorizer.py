@@ -413,7 +413,7 @@ class SingleBattleEnvTensorizer:
         position += 1
 
         # Encode player statuses
-        for status_uid, (status, amount) in player.get_active_statuses().items():
+        for status_uid, amount in player.get_active_statuses().items():
             check_context_size()
 
             token_types[position] = TokenType.ENTITY_STATUS.value
@@ -490,7 +490,7 @@ class SingleBattleEnvTensorizer:
                     position += 1
 
                 # Enemy statuses
-                for status_uid, (status, amount) in enemy.get_active_statuses().items():
+                for status_uid, amount in enemy.get_active_statuses().items():
                     check_context_size()
 
                     token_types[position] = TokenType.ENTITY_STATUS.value
@@ -659,4 +659,10 @@ class SingleBattleEnvTensorizer:
         Args:
             filename: The path to load the data from.
         """
-        self.playthrough_steps = torch.load(filename)
+        try:
+            # Map the tensor storages from the file instead of reading them
+            # all into memory up front
+            self.playthrough_steps = torch.load(filename, mmap=True)
+        except RuntimeError:
+            # Files saved in the legacy (non-zip) format cannot be mapped
+            self.playthrough_steps = torch.load(filename)
@@ -0,0 +1,107 @@
+from SampleEfficientRL.Envs.Deckbuilder.EnvAction import EntityDescriptor
+from SampleEfficientRL.Envs.Deckbuilder.IroncladStarterVsCultist import (
+    IRONCLAD_STARTING_HP,
+    IroncladStarterVsCultist,
+)
+from SampleEfficientRL.Envs.Deckbuilder.Opponents.FixedHpCultist import (
+    FIXED_HP_CULTIST_MAX_HEALTH,
+)
+from SampleEfficientRL.Envs.Deckbuilder.Status import StatusUIDs
+
+PLAYER = EntityDescriptor(is_player=True)
+CULTIST = EntityDescriptor(is_player=False, enemy_idx=0)
+
+
+def attack_cultist(
+    damage: int, strength: int = 0, vulnerable: int = 0, block: int = 0
+) -> IroncladStarterVsCultist:
+    env = IroncladStarterVsCultist()
+    env.find_entity_by_descriptor(PLAYER).set_status_amount(
+        StatusUIDs.STRENGTH, strength
+    )
+    cultist = env.find_entity_by_descriptor(CULTIST)
+    cultist.set_status_amount(StatusUIDs.VULNERABLE, vulnerable)
+    cultist.set_status_amount(StatusUIDs.BLOCK, block)
+    env.attack_entity(source=PLAYER, target=CULTIST, amount=damage)
+    return env
+
+
+def cultist_damage_taken(env: IroncladStarterVsCultist) -> int:
+    cultist = env.find_entity_by_descriptor(CULTIST)
+    return FIXED_HP_CULTIST_MAX_HEALTH - cultist.current_health
+
+
+def cultist_block(env: IroncladStarterVsCultist) -> int:
+    cultist = env.find_entity_by_descriptor(CULTIST)
+    return cultist.get_active_statuses().get(StatusUIDs.BLOCK, 0)
+
+
+def test_unmodified_attack() -> None:
+    assert cultist_damage_taken(attack_cultist(6)) == 6
+
+
+def test_strength_adds_damage() -> None:
+    assert cultist_damage_taken(attack_cultist(6, strength=3)) == 9
+
+
+def test_vulnerable_rounds_down() -> None:
+    assert cultist_damage_taken(attack_cultist(6, vulnerable=1)) == 9
+    assert cultist_damage_taken(attack_cultist(5, vulnerable=1)) == 7
+
+
+def test_strength_is_added_before_vulnerable() -> None:
+    # (5 + 2) * 1.5 rounded down, not 5 * 1.5 + 2
+    assert cultist_damage_taken(attack_cultist(5, strength=2, vulnerable=1)) == 10
+
+
+def test_block_fully_absorbs_attack() -> None:
+    env = attack_cultist(6, block=10)
+    assert cultist_damage_taken(env) == 0
+    assert cultist_block(env) == 4
+
+
+def test_block_partially_absorbs_attack() -> None:
+    env = attack_cultist(8, block=5)
+    assert cultist_damage_taken(env) == 3
+    assert cultist_block(env) == 0
+    cultist = env.find_entity_by_descriptor(CULTIST)
+    assert StatusUIDs.BLOCK not in cultist.get_active_statuses()
+
+
+def test_block_equal_to_damage() -> None:
+    env = attack_cultist(6, block=6)
+    assert cultist_damage_taken(env) == 0
+    cultist = env.find_entity_by_descriptor(CULTIST)
+    assert StatusUIDs.BLOCK not in cultist.get_active_statuses()
+
+
+def test_block_applies_after_strength_and_vulnerable() -> None:
+    # (4 + 2) * 1.5 = 9 damage against 5 block
+    env = attack_cultist(4, strength=2, vulnerable=1, block=5)
+    assert cultist_damage_taken(env) == 4
+    assert cultist_block(env) == 0
+
+
+def test_ritual_accumulates_strength() -> None:
+    env = IroncladStarterVsCultist()
+    cultist = env.find_entity_by_descriptor(CULTIST)
+    player = env.find_entity_by_descriptor(PLAYER)
+
+    # Turn 0: the cultist performs its ritual
+    env.start_turn()
+    env.end_turn()
+    assert cultist.get_active_statuses()[StatusUIDs.RITUAL] == 4
+    assert StatusUIDs.STRENGTH not in cultist.get_active_statuses()
+    assert player.current_health == IRONCLAD_STARTING_HP
+
+    # Each following turn, Ritual adds its amount of Strength before the
+    # cultist attacks for 2
+    env.start_turn()
+    assert cultist.get_active_statuses()[StatusUIDs.STRENGTH] == 4
+    env.end_turn()
+    assert player.current_health == IRONCLAD_STARTING_HP - 6
+
+    env.start_turn()
+    assert cultist.get_active_statuses()[StatusUIDs.STRENGTH] == 8
+    env.end_turn()
+    assert player.current_health == IRONCLAD_STARTING_HP - 6 - 10
@@ -1,11 +1,22 @@
+import dataclasses
+import random
 import subprocess
+import sys
 import unittest
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import Any, Iterator, List, Optional
+from unittest.mock import patch
 
 import pytest
 
+from SampleEfficientRL.Envs.Deckbuilder.GameOutputManager import GameOutputManager
+from SampleEfficientRL.Envs.Deckbuilder.RandomWalkAgent import main as random_walk_main
+from SampleEfficientRL.Envs.Deckbuilder.ReplayExplorer import (
+    DecodedStep,
+    ReplayExplorer,
+)
+
 
 class ReplayExplorerTest(unittest.TestCase):
     """Test case for the ReplayExplorer functionality."""
@@ -199,5 +210,113 @@ class ReplayExplorerTest(unittest.TestCase):
                         )
 
 
+@pytest.fixture(scope="module")
+def recorded_playthrough(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Record a seeded random walk playthrough to replay."""
+    test_dir = tmp_path_factory.mktemp("replay")
+    pt_filename = test_dir / "random_walk.pt"
+    random.seed(0)
+    random_walk_argv = [
+        "RandomWalkAgent",
+        "--output-file",
+        str(pt_filename),
+        "--log-file",
+        str(test_dir / "original_log.txt"),
+        "--end-turn-probability",
+        "0.3",
+    ]
+    with patch.object(sys, "argv", random_walk_argv):
+        random_walk_main()
+    return pt_filename
+
+
+def replay_lines(replay_file: Path, log_name: str, **kwargs: Any) -> List[str]:
+    """Replay a playthrough and return the lines of its log."""
+    replay_log = replay_file.parent / log_name
+    output = GameOutputManager(str(replay_log))
+    ReplayExplorer(str(replay_file), output, **kwargs).replay()
+    output.close()
+    return replay_log.read_text(encoding="utf-8").splitlines()
+
+
+def test_diff_states_only_suppresses_unchanged_sections(
+    recorded_playthrough: Path,
+) -> None:
+    full_lines = replay_lines(recorded_playthrough, "full_log.txt")
+    diff_lines = replay_lines(recorded_playthrough, "diff_log.txt", diff_states=True)
+
+    # Diffing only ever leaves lines out, in order
+    remaining_full_lines = iter(full_lines)
+    for line in diff_lines:
+        assert line in remaining_full_lines
+
+    # Sections that stay the same between states are suppressed
+    for section_header in ("Player HP:", "Player Hand:", "Opponent HP:"):
+        full_count = sum(line.startswith(section_header) for line in full_lines)
+        diff_count = sum(line.startswith(section_header) for line in diff_lines)
+        assert 0 < diff_count < full_count, section_header
+
+
+def test_diff_states_prints_changed_sections(
+    recorded_playthrough: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    explorer = ReplayExplorer(
+        str(recorded_playthrough), GameOutputManager(), diff_states=True
+    )
+    step = next(explorer.detensorize_playthrough_data())
+    capsys.readouterr()
+
+    def printed_state(state: Any) -> str:
+        explorer.print_detailed_state(state)
+        return capsys.readouterr().out
+
+    # The first state prints every section it has
+    first = printed_state(step)
+    assert "Player HP:" in first
+    assert "Player Hand:" in first
+    assert "Opponent HP:" in first
+
+    # Printing the same state again suppresses all of them
+    again = printed_state(step)
+    assert "Player HP:" not in again
+    assert "Player Hand:" not in again
+    assert "Opponent HP:" not in again
+
+    # Only the section that changed is printed
+    player = dataclasses.replace(step.player, hp=step.player.hp - 1)
+    changed = printed_state(dataclasses.replace(step, player=player))
+    assert f"Player HP: {player.hp}/" in changed
+    assert "Player Hand:" not in changed
+    assert "Opponent HP:" not in changed
+
+
+def test_diff_states_compares_section_keys_not_hashes(
+    recorded_playthrough: Path,
+) -> None:
+    explorer = ReplayExplorer(
+        str(recorded_playthrough), GameOutputManager(), diff_states=True
+    )
+    # hash(-1) == hash(-2) in CPython, so these keys collide
+    assert hash((-1,)) == hash((-2,))
+    assert explorer._section_changed("player", (-1,))
+    assert explorer._section_changed("player", (-2,))
+    assert not explorer._section_changed("player", (-2,))
+
+
+def test_lazy_decode_matches_full_decode(recorded_playthrough: Path) -> None:
+    lazy_lines = replay_lines(recorded_playthrough, "lazy_replay.log")
+
+    def decode_all_steps(
+        explorer: ReplayExplorer, needed: List[bool]
+    ) -> Iterator[Optional[DecodedStep]]:
+        return explorer.detensorize_playthrough_data()
+
+    with patch.object(ReplayExplorer, "_decode_needed_steps", decode_all_steps):
+        full_lines = replay_lines(recorded_playthrough, "full_replay.log")
+
+    assert lazy_lines == full_lines
+    assert any("Agent won" in line or "defeated" in line for line in lazy_lines)
+
+
 if __name__ == "__main__":
     unittest.main()
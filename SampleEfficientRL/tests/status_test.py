@@ -0,0 +1,147 @@
+from typing import List, Optional
+
+from SampleEfficientRL.Envs.Deckbuilder.DeckbuilderSingleBattleEnv import (
+    DeckbuilderSingleBattleEnv,
+)
+from SampleEfficientRL.Envs.Deckbuilder.Entity import Entity
+from SampleEfficientRL.Envs.Deckbuilder.EnvAction import (
+    EntityDescriptor,
+    EnvAction,
+    EnvActionType,
+)
+from SampleEfficientRL.Envs.Deckbuilder.IroncladStarterVsCultist import (
+    IroncladStarterVsCultist,
+)
+from SampleEfficientRL.Envs.Deckbuilder.Status import (
+    STATUS_EFFECTS,
+    STATUS_MASK_BITS,
+    EffectTriggerPoint,
+    StatusEffectCallback,
+    StatusesOrder,
+    StatusUIDs,
+)
+from SampleEfficientRL.Envs.Deckbuilder.Statuses.Block import BLOCK_SINGLETON, Block
+from SampleEfficientRL.Envs.Deckbuilder.Statuses.Strength import STRENGTH_SINGLETON
+from SampleEfficientRL.Envs.Deckbuilder.Statuses.Vulnerable import (
+    VULNERABLE_SINGLETON,
+)
+
+BLOCK_IDX = StatusUIDs.BLOCK.value - 1
+STRENGTH_IDX = StatusUIDs.STRENGTH.value - 1
+
+
+def test_status_effects_are_registered_when_the_class_is_defined() -> None:
+    block_row = STATUS_EFFECTS[BLOCK_IDX]
+    on_end_of_turn = BLOCK_SINGLETON.get_effects()[EffectTriggerPoint.ON_END_OF_TURN]
+    assert block_row[EffectTriggerPoint.ON_END_OF_TURN.value - 1] is on_end_of_turn
+    assert block_row.count(None) == len(EffectTriggerPoint) - 1
+
+    # Constructing a status leaves the dispatch table alone
+    Block()
+    assert STATUS_EFFECTS[BLOCK_IDX] is block_row
+
+
+def make_entity() -> Entity:
+    return Entity(IroncladStarterVsCultist(), 10)
+
+
+def test_set_status_amount_activates_status() -> None:
+    entity = make_entity()
+    entity.set_status_amount(StatusUIDs.BLOCK, 5)
+    assert entity.status_amounts[BLOCK_IDX] == 5
+    assert entity._active_status_idxs == [BLOCK_IDX]
+    assert entity.status_mask == STATUS_MASK_BITS[BLOCK_IDX]
+    assert entity.get_active_statuses() == {StatusUIDs.BLOCK: 5}
+
+    entity.set_status_amount(StatusUIDs.BLOCK, 3)
+    assert entity.status_amounts[BLOCK_IDX] == 3
+    assert entity._active_status_idxs == [BLOCK_IDX]
+    assert entity.status_mask == STATUS_MASK_BITS[BLOCK_IDX]
+
+
+def test_non_positive_amount_resets_status() -> None:
+    for amount in (0, -2):
+        entity = make_entity()
+        entity.set_status_amount(StatusUIDs.BLOCK, 5)
+        entity.set_status_amount(StatusUIDs.STRENGTH, 2)
+        entity.set_status_amount(StatusUIDs.BLOCK, amount)
+        assert entity.status_amounts[BLOCK_IDX] == 0
+        assert entity._active_status_idxs == [STRENGTH_IDX]
+        assert entity.status_mask == STATUS_MASK_BITS[STRENGTH_IDX]
+
+        # Setting an inactive status to a non-positive amount is a no-op
+        entity.set_status_amount(StatusUIDs.BLOCK, amount)
+        assert entity.status_amounts[BLOCK_IDX] == 0
+        assert entity._active_status_idxs == [STRENGTH_IDX]
+
+
+def test_apply_status_accumulates_and_reapplies() -> None:
+    entity = make_entity()
+    entity.apply_status(BLOCK_SINGLETON, 4)
+    entity.apply_status(STRENGTH_SINGLETON, 1)
+    entity.apply_status(BLOCK_SINGLETON, 3)
+    assert entity.get_active_statuses() == {
+        StatusUIDs.BLOCK: 7,
+        StatusUIDs.STRENGTH: 1,
+    }
+
+    entity.apply_status(BLOCK_SINGLETON, -7)
+    assert entity._active_status_idxs == [STRENGTH_IDX]
+    assert entity.status_mask == STATUS_MASK_BITS[STRENGTH_IDX]
+
+    # A re-applied status starts from zero and is active again
+    entity.apply_status(BLOCK_SINGLETON, 2)
+    assert entity.status_amounts[BLOCK_IDX] == 2
+    assert entity._active_status_idxs == [STRENGTH_IDX, BLOCK_IDX]
+    assert entity.status_mask == (
+        STATUS_MASK_BITS[STRENGTH_IDX] | STATUS_MASK_BITS[BLOCK_IDX]
+    )
+
+    entity.reset_status(StatusUIDs.STRENGTH)
+    assert entity.status_amounts[STRENGTH_IDX] == 0
+    assert entity._active_status_idxs == [BLOCK_IDX]
+    assert entity.status_mask == STATUS_MASK_BITS[BLOCK_IDX]
+
+
+def test_applying_non_positive_amount_to_inactive_status_is_ignored() -> None:
+    entity = make_entity()
+    entity.apply_status(VULNERABLE_SINGLETON, -1)
+    entity.apply_status(VULNERABLE_SINGLETON, 0)
+    assert entity.get_active_statuses() == {}
+    assert entity.status_mask == 0
+
+
+def test_callbacks_are_dispatched_in_statuses_order() -> None:
+    dispatched: List[StatusUIDs] = []
+
+    def recorder(status_uid: StatusUIDs) -> StatusEffectCallback:
+        def record(
+            env: DeckbuilderSingleBattleEnv, amount: int, action: EnvAction
+        ) -> Optional[EnvAction]:
+            dispatched.append(status_uid)
+            return action
+
+        return record
+
+    env = IroncladStarterVsCultist()
+    cultist = EntityDescriptor(is_player=False, enemy_idx=0)
+    entity = env.find_entity_by_descriptor(cultist)
+    # Apply the statuses in an order unrelated to StatusesOrder
+    applied = sorted(StatusUIDs, key=lambda status_uid: -status_uid.value)[::2]
+    for status_uid in applied:
+        entity.set_status_amount(status_uid, 1)
+
+    death_idx = EffectTriggerPoint.ON_DEATH.value - 1
+    registered_rows = list(STATUS_EFFECTS)
+    try:
+        for status_uid in StatusUIDs:
+            row = list(STATUS_EFFECTS[status_uid.value - 1])
+            row[death_idx] = recorder(status_uid)
+            STATUS_EFFECTS[status_uid.value - 1] = tuple(row)
+
+        action = EnvAction(EnvActionType.END_OF_TURN, cultist)
+        env.apply_action_callbacks(action, cultist, EffectTriggerPoint.ON_DEATH)
+    finally:
+        STATUS_EFFECTS[:] = registered_rows
+    assert len(dispatched) == len(applied) > 2
+    assert dispatched == [uid for uid in StatusesOrder if uid in applied]